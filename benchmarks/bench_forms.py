@@ -0,0 +1,85 @@
+# Copyright 2025 Mohammadjavad Morady
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Form extraction for urlencoded, multipart and JSON bodies at several payload
+sizes, plus building and validating dynamic pydantic models.
+"""
+
+from fastapi import FastAPI, Request
+
+from benchmarks.harness import CallCase, HttpCase
+from providers.form.methods.data_strategies import (
+    FormDataStrategy,
+    JSONDataStrategy,
+)
+from providers.form.methods.forms import build_form_class, create_field
+
+FIELD_COUNTS = (4, 64, 512)
+
+
+def _fields(count: int) -> list[tuple]:
+    return [create_field(f"field_{i}", str) for i in range(count)]
+
+
+def _payload(count: int) -> dict[str, str]:
+    return {f"field_{i}": f"value-{i}" for i in range(count)}
+
+
+def _form_app(count: int, strategy) -> FastAPI:
+    form_cls = build_form_class(f"BenchForm{count}", _fields(count), strategy)
+    app = FastAPI()
+
+    @app.post("/submit")
+    async def submit(request: Request):
+        form = form_cls()
+        await form.from_request(request)
+        return {"fields": len(form.to_dict())}
+
+    return app
+
+
+def cases() -> list:
+    result = []
+    for count in FIELD_COUNTS:
+        payload = _payload(count)
+        multipart = {key: (None, value) for key, value in payload.items()}
+        form_app = _form_app(count, FormDataStrategy())
+        json_app = _form_app(count, JSONDataStrategy())
+
+        async def urlencoded(client, i, payload=payload):
+            return await client.post("/submit", data=payload)
+
+        async def multipart_body(client, i, multipart=multipart):
+            return await client.post("/submit", files=multipart)
+
+        async def json_body(client, i, payload=payload):
+            return await client.post("/submit", json=payload)
+
+        result.append(HttpCase(f"form.urlencoded.{count}", form_app, urlencoded))
+        result.append(HttpCase(f"form.multipart.{count}", form_app, multipart_body))
+        result.append(HttpCase(f"form.json.{count}", json_app, json_body))
+
+        fields = _fields(count)
+        model = build_form_class(f"Validate{count}", fields, JSONDataStrategy())
+
+        def build(i, count=count, fields=fields):
+            build_form_class(f"Build{count}", fields, JSONDataStrategy())
+
+        def validate(i, model=model, payload=payload):
+            model().model_cls(**payload)
+
+        result.append(CallCase(f"model.build.{count}", build))
+        result.append(CallCase(f"model.validate.{count}", validate))
+    return result
@@ -0,0 +1,136 @@
+# Copyright 2025 Mohammadjavad Morady
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Users reads and token verification over gRPC, each paired with the same call
+over REST. Both sides of a pair run sequentially over a real loopback socket,
+read the same ids from the same database and skip the response cache, so the
+two numbers printed next to each other are directly comparable:
+
+    python -m benchmarks.run -k grpc
+"""
+
+import socket
+import time
+import uuid
+
+import httpx
+import jwt
+from fastapi import FastAPI
+
+from benchmarks.bench_users import _users_module
+from benchmarks.harness import CallCase, _UvicornThread
+
+SECRET_KEY = "benchmark-secret-key-with-32-bytes!"
+SEED_USERS = 100
+
+
+def _rest_app(users) -> FastAPI:
+    # The REST handlers without the response cache and admission middleware,
+    # which the gRPC services do not go through either.
+    app = FastAPI()
+    app.add_api_route(
+        "/users/{user_id}", users.read_user, response_model=users.UserResponse
+    )
+    app.add_api_route("/users/", users.read_all_users)
+    return app
+
+
+def _free_address() -> str:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return f"127.0.0.1:{sock.getsockname()[1]}"
+
+
+def cases() -> list:
+    import grpc
+
+    from providers.auth.methods.auth_jwt import JWTAuth
+    from providers.rpc.methods.services import AuthService, UsersService, build_server
+    from providers.rpc.protos import providers_pb2, providers_pb2_grpc
+
+    users = _users_module()
+    run = uuid.uuid4().hex[:8]
+    db = users.SessionLocal()
+    try:
+        seeded = [
+            users.User(name=f"grpc-{i}", email=f"grpc-{run}-{i}@example.com")
+            for i in range(SEED_USERS)
+        ]
+        db.add_all(seeded)
+        db.commit()
+        ids = [user.id for user in seeded]
+    finally:
+        db.close()
+
+    token = jwt.encode({"sub": "bench", "exp": int(time.time()) + 3600}, SECRET_KEY)
+    clients = {}
+
+    async def connect():
+        # The servers and clients must be created inside the running event loop.
+        if not clients:
+            address = _free_address()
+            server = build_server(
+                address,
+                users=UsersService(users.SessionLocal, users.User),
+                auth=AuthService(JWTAuth(secret_key=SECRET_KEY)),
+            )
+            await server.start()
+            channel = grpc.aio.insecure_channel(address)
+            rest = _UvicornThread(_rest_app(users)).__enter__()
+            clients["server"] = server
+            clients["channel"] = channel
+            clients["rest_server"] = rest
+            clients["users"] = providers_pb2_grpc.UsersStub(channel)
+            clients["auth"] = providers_pb2_grpc.AuthStub(channel)
+            clients["rest"] = httpx.AsyncClient(base_url=rest.base_url)
+        return clients
+
+    async def get_user(i):
+        stub = (await connect())["users"]
+        return await stub.GetUser(providers_pb2.UserId(id=ids[i % SEED_USERS]))
+
+    async def rest_get_user(i):
+        client = (await connect())["rest"]
+        return await client.get(f"/users/{ids[i % SEED_USERS]}")
+
+    async def list_users(i):
+        stub = (await connect())["users"]
+        request = providers_pb2.ListUsersRequest(page_size=500)
+        return [user async for user in stub.ListUsers(request)]
+
+    async def rest_list_users(i):
+        client = (await connect())["rest"]
+        return await client.get("/users/")
+
+    async def verify_token(i):
+        stub = (await connect())["auth"]
+        return await stub.VerifyToken(providers_pb2.VerifyTokenRequest(token=token))
+
+    async def close():
+        if clients:
+            await clients["rest"].aclose()
+            await clients["channel"].close()
+            await clients["server"].stop(grace=None)
+            clients["rest_server"].__exit__(None, None, None)
+            clients.clear()
+
+    return [
+        CallCase("grpc.get_user", get_user),
+        CallCase("grpc.rest_get_user", rest_get_user),
+        CallCase("grpc.list_users", list_users),
+        CallCase("grpc.rest_list_users", rest_list_users),
+        # The last case shuts the shared servers down.
+        CallCase("grpc.verify_token", verify_token, teardown=close),
+    ]
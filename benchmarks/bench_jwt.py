@@ -0,0 +1,81 @@
+# Copyright 2025 Mohammadjavad Morady
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+JWT verification throughput for HS256 and RS256 tokens, both as a direct
+`JWTAuth.authenticate` call and as a protected FastAPI route.
+"""
+
+import time
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi import Depends, FastAPI, Request
+
+from benchmarks.harness import CallCase, HttpCase
+from providers.auth.methods.auth_jwt import JWTAuth
+from providers.hpc.methods.probes import build_request
+
+HS256_SECRET = "benchmark-secret-key-with-32-bytes!"
+
+
+def _rsa_keys() -> tuple[bytes, bytes]:
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    public_pem = key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    return private_pem, public_pem
+
+
+def _protected_app(auth: JWTAuth) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/protected", dependencies=[Depends(auth.authenticate)])
+    async def protected(request: Request):
+        return {"sub": request.state.user_payload["sub"]}
+
+    return app
+
+
+def cases() -> list:
+    private_pem, public_pem = _rsa_keys()
+    payload = {"sub": "bench-user", "exp": int(time.time()) + 3600}
+    setups = {
+        "hs256": (JWTAuth(HS256_SECRET), jwt.encode(payload, HS256_SECRET, "HS256")),
+        "rs256": (
+            JWTAuth(public_pem, algorithm="RS256"),
+            jwt.encode(payload, private_pem, "RS256"),
+        ),
+    }
+
+    result = []
+    for name, (auth, token) in setups.items():
+        headers = {"Authorization": f"Bearer {token}"}
+
+        async def verify(i, auth=auth, headers=headers):
+            await auth.authenticate(build_request(headers=headers))
+
+        async def call(client, i, headers=headers):
+            return await client.get("/protected", headers=headers)
+
+        result.append(CallCase(f"jwt.verify.{name}", verify))
+        result.append(HttpCase(f"jwt.route.{name}", _protected_app(auth), call))
+    return result
@@ -0,0 +1,153 @@
+# Copyright 2025 Mohammadjavad Morady
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Per-request allocations and RSS of the users list endpoint at 10k rows, for the
+lean column-only read path of `database/test.py` against the previous ORM +
+pydantic `from_attributes` path. Each case runs in a fresh process so RSS
+growth is not hidden by an earlier case's high-water mark.
+
+    python -m benchmarks.bench_memory
+    python -m benchmarks.bench_memory --rows 50000 -n 10
+"""
+
+import argparse
+import asyncio
+import importlib
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import httpx
+from fastapi import FastAPI
+
+from providers.serving.methods.prefork import memory_usage_kib
+
+CASES = ("lean", "orm")
+
+
+def _users_module():
+    return importlib.import_module("database.test")
+
+
+def _seed(rows: int) -> None:
+    users = _users_module()
+    db = users.SessionLocal()
+    try:
+        db.add_all(
+            users.User(name=f"user-{i}", email=f"user-{i}@example.com")
+            for i in range(rows)
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def _orm_app(users) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/users/", response_model=list[users.UserResponse])
+    def read_all_users():
+        db = users.SessionLocal()
+        try:
+            return db.query(users.User).all()
+        finally:
+            db.close()
+
+    return app
+
+
+async def _measure(app, iterations: int) -> dict:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as c:
+        (await c.get("/users/")).raise_for_status()
+        rss_before = memory_usage_kib().get("rss", 0)
+        peaks, elapsed = [], 0
+        tracemalloc.start()
+        try:
+            for _ in range(iterations):
+                tracemalloc.reset_peak()
+                baseline = tracemalloc.get_traced_memory()[0]
+                started = time.perf_counter_ns()
+                response = await c.get("/users/")
+                elapsed += time.perf_counter_ns() - started
+                response.raise_for_status()
+                peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+                del response
+        finally:
+            tracemalloc.stop()
+        # RSS is sampled without tracemalloc, whose bookkeeping inflates it.
+        for _ in range(iterations):
+            (await c.get("/users/")).raise_for_status()
+        rss_after = memory_usage_kib().get("rss", 0)
+    return {
+        "peak_alloc_kib": max(peaks) / 1024,
+        "mean_alloc_kib": sum(peaks) / len(peaks) / 1024,
+        "mean_ms_traced": elapsed / iterations / 1e6,
+        "rss_kib": rss_after,
+        "rss_growth_kib": rss_after - rss_before,
+    }
+
+
+def run_case(case: str, iterations: int) -> dict:
+    """
+    Measures one case in this process.
+
+    Args:
+        case (str): "lean" for the current endpoint, "orm" for the ORM path.
+        iterations (int): Measured requests.
+
+    Returns:
+        dict: Allocation peaks per request, traced latency and RSS, in KiB/ms.
+    """
+    users = _users_module()
+    app = users.app if case == "lean" else _orm_app(users)
+    return asyncio.run(_measure(app, iterations))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("-n", "--iterations", type=int, default=5)
+    parser.add_argument("--case", choices=CASES, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.case:
+        result = run_case(args.case, args.iterations)
+        print(" ".join(f"{key}={value:.1f}" for key, value in result.items()))
+        return 0
+
+    path = Path(tempfile.mkdtemp(prefix="bench-memory-")) / "users.db"
+    env = dict(os.environ, DATABASE_URL=f"sqlite:///{path}")
+    os.environ.update(env)
+    _seed(args.rows)
+    for case in CASES:
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_memory", "--case", case]
+            + ["-n", str(args.iterations)],
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        print(f"users.read_all.{args.rows}.{case:<5} {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
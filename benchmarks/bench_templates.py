@@ -0,0 +1,69 @@
+# Copyright 2025 Mohammadjavad Morady
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Template rendering of a small and a large Jinja2 template, both as a direct
+`JinjaTemplateLoader.render` call and through a FastAPI route.
+"""
+
+import tempfile
+from pathlib import Path
+
+from fastapi import FastAPI
+
+from benchmarks.harness import CallCase, HttpCase
+from providers.template_loader.methods.jinja_loader import JinjaTemplateLoader
+
+SMALL = "<h1>{{ title }}</h1>"
+LARGE = """<html><body><h1>{{ title }}</h1><table>
+{% for row in rows %}<tr><td>{{ row.id }}</td><td>{{ row.name }}</td>
+<td>{{ row.email }}</td></tr>{% endfor %}
+</table></body></html>"""
+
+CONTEXTS = {
+    "small": {"title": "Benchmark"},
+    "large": {
+        "title": "Benchmark",
+        "rows": [
+            {"id": i, "name": f"user-{i}", "email": f"user-{i}@example.com"}
+            for i in range(1000)
+        ],
+    },
+}
+
+
+def cases() -> list:
+    templates_dir = Path(tempfile.mkdtemp(prefix="bench-templates-"))
+    (templates_dir / "small.html").write_text(SMALL)
+    (templates_dir / "large.html").write_text(LARGE)
+    loader = JinjaTemplateLoader(templates_dir=str(templates_dir))
+
+    app = FastAPI()
+
+    @app.get("/render/{size}")
+    async def render(size: str):
+        return loader.render(f"{size}.html", CONTEXTS[size])
+
+    result = []
+    for size, context in CONTEXTS.items():
+
+        def direct(i, size=size, context=context):
+            loader.render(f"{size}.html", context)
+
+        async def route(client, i, size=size):
+            return await client.get(f"/render/{size}")
+
+        result.append(CallCase(f"template.render.{size}", direct))
+        result.append(HttpCase(f"template.route.{size}", app, route))
+    return result
@@ -0,0 +1,117 @@
+# Copyright 2025 Mohammadjavad Morady
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Users CRUD from `database/test.py`, run against a throwaway SQLite database.
+
+The handlers are served without the admission middleware: its limits are
+sized for the connection pool, and under `--mode uvicorn -c 32` it would shed
+the benchmark's own load with 503s instead of measuring the handlers. The
+response cache is left out too, so `users.read` measures the database read;
+`users.read.cached` measures the same reads through the ETag cache.
+"""
+
+import importlib
+import os
+import sys
+import tempfile
+import uuid
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+
+from benchmarks.harness import HttpCase
+from providers.response_cache.methods.etag_middleware import (
+    CachePolicy,
+    ResponseCacheMiddleware,
+)
+
+SEED_USERS = 100
+
+
+def _users_module():
+    # The database URL is read when `database.test` is first imported; later
+    # calls share that module and its database.
+    if "database.test" not in sys.modules:
+        path = Path(tempfile.mkdtemp(prefix="bench-users-")) / "users.db"
+        os.environ["DATABASE_URL"] = f"sqlite:///{path}"
+    return importlib.import_module("database.test")
+
+
+def _handlers_app(users, cached: bool = False) -> FastAPI:
+    app = FastAPI()
+    app.router.routes.extend(
+        route for route in users.app.routes if isinstance(route, APIRoute)
+    )
+    if cached:
+        app.add_middleware(
+            ResponseCacheMiddleware,
+            policies={"/users/{user_id}": CachePolicy(ttl=30)},
+            backend=users.response_cache,
+        )
+    return app
+
+
+def cases() -> list:
+    users = _users_module()
+    app = _handlers_app(users)
+    cached_app = _handlers_app(users, cached=True)
+    run = uuid.uuid4().hex[:8]
+    db = users.SessionLocal()
+    try:
+        db.add_all(
+            users.User(name=f"seed-{i}", email=f"seed-{run}-{i}@example.com")
+            for i in range(SEED_USERS)
+        )
+        db.commit()
+    finally:
+        db.close()
+
+    async def create(client, i):
+        return await client.post(
+            "/users/", json={"name": f"user-{i}", "email": f"c-{run}-{i}@example.com"}
+        )
+
+    async def read(client, i):
+        return await client.get(f"/users/{i % SEED_USERS + 1}")
+
+    async def read_all(client, i):
+        return await client.get("/users/")
+
+    async def search(client, i):
+        return await client.get("/users/search/", params={"name": "seed-1"})
+
+    async def update(client, i):
+        return await client.put(
+            f"/users/{i % SEED_USERS + 1}",
+            json={"name": f"seed-{i % SEED_USERS}", "email": f"u-{run}-{i}@x.com"},
+        )
+
+    async def create_delete(client, i):
+        response = await client.post(
+            "/users/", json={"name": "tmp", "email": f"d-{run}-{i}@example.com"}
+        )
+        response.raise_for_status()
+        return await client.delete(f"/users/{response.json()['id']}")
+
+    return [
+        HttpCase("users.create", app, create),
+        HttpCase("users.read", app, read),
+        HttpCase("users.read.cached", cached_app, read),
+        HttpCase("users.read_all", app, read_all),
+        HttpCase("users.search", app, search),
+        HttpCase("users.update", app, update),
+        HttpCase("users.create_delete", app, create_delete),
+    ]
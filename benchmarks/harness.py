@@ -0,0 +1,250 @@
+# Copyright 2025 Mohammadjavad Morady
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module contains the benchmark harness: case definitions, the in-process and
+uvicorn load runners, and JSON baseline comparison with a regression threshold.
+"""
+
+import asyncio
+import inspect
+import json
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Awaitable, Callable
+
+import httpx
+
+BASELINE_DIR = Path(__file__).parent / "baselines"
+
+
+@dataclass
+class CallCase:
+    """
+    A benchmark that calls a function directly, without HTTP.
+
+    Attributes:
+        name (str): Unique case name, used as the baseline key.
+        fn (Callable): Sync or async callable taking the iteration index.
+        teardown (Callable | None): Sync or async callable run once after the
+                                    case, in the same event loop.
+    """
+
+    name: str
+    fn: Callable
+    teardown: Callable | None = None
+
+
+@dataclass
+class HttpCase:
+    """
+    A benchmark that sends requests to an ASGI application.
+
+    Attributes:
+        name (str): Unique case name, used as the baseline key.
+        app (Callable): ASGI application under test.
+        call (Callable): Coroutine function taking an `httpx.AsyncClient` and
+                         the iteration index, returning the response.
+    """
+
+    name: str
+    app: Callable
+    call: Callable[[httpx.AsyncClient, int], Awaitable[httpx.Response]]
+
+
+@dataclass
+class Result:
+    """
+    Measured statistics of a single case.
+
+    Attributes:
+        name (str): Case name.
+        iterations (int): Number of measured iterations.
+        ops_per_sec (float): Throughput.
+        mean_us (float): Mean latency, in microseconds.
+        p50_us (float): Median latency, in microseconds.
+        p99_us (float): 99th percentile latency, in microseconds.
+    """
+
+    name: str
+    iterations: int
+    ops_per_sec: float
+    mean_us: float
+    p50_us: float
+    p99_us: float
+
+
+def _summarize(name: str, samples_ns: list[int], elapsed_ns: int) -> Result:
+    ordered = sorted(samples_ns)
+    count = len(ordered)
+    return Result(
+        name=name,
+        iterations=count,
+        ops_per_sec=round(count / (elapsed_ns / 1e9), 2),
+        mean_us=round(sum(ordered) / count / 1e3, 2),
+        p50_us=round(ordered[count // 2] / 1e3, 2),
+        p99_us=round(ordered[min(count - 1, int(count * 0.99))] / 1e3, 2),
+    )
+
+
+async def _timed(call: Callable, iterations: int, offset: int = 0) -> list[int]:
+    samples = []
+    for i in range(offset, offset + iterations):
+        started = time.perf_counter_ns()
+        result = call(i)
+        if inspect.isawaitable(result):
+            result = await result
+        samples.append(time.perf_counter_ns() - started)
+        if isinstance(result, httpx.Response):
+            result.raise_for_status()
+    return samples
+
+
+async def run_inprocess(case, iterations: int, warmup: int) -> Result:
+    """
+    Runs a case sequentially in this process, through `httpx.ASGITransport`
+    for HTTP cases.
+    """
+    if isinstance(case, CallCase):
+        await _timed(case.fn, warmup)
+        started = time.perf_counter_ns()
+        samples = await _timed(case.fn, iterations, offset=warmup)
+        elapsed = time.perf_counter_ns() - started
+        if case.teardown is not None:
+            result = case.teardown()
+            if inspect.isawaitable(result):
+                await result
+        return _summarize(case.name, samples, elapsed)
+
+    transport = httpx.ASGITransport(app=case.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as c:
+        await _timed(lambda i: case.call(c, i), warmup)
+        started = time.perf_counter_ns()
+        samples = await _timed(lambda i: case.call(c, i), iterations, offset=warmup)
+    return _summarize(case.name, samples, time.perf_counter_ns() - started)
+
+
+class _UvicornThread(threading.Thread):
+    def __init__(self, app):
+        import uvicorn
+
+        super().__init__(daemon=True)
+        config = uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning")
+        self.server = uvicorn.Server(config)
+
+    def run(self):
+        self.server.run()
+
+    @property
+    def base_url(self) -> str:
+        sockets = self.server.servers[0].sockets
+        host, port = sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self.start()
+        while not self.server.started:
+            time.sleep(0.01)
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.should_exit = True
+        self.join()
+
+
+async def run_uvicorn(case, iterations: int, warmup: int, concurrency: int) -> Result:
+    """
+    Runs an HTTP case against a real uvicorn server with concurrent clients.
+    Call cases have no server side and fall back to `run_inprocess`.
+    """
+    if isinstance(case, CallCase):
+        return await run_inprocess(case, iterations, warmup)
+
+    limits = httpx.Limits(max_connections=concurrency)
+    with _UvicornThread(case.app) as server:
+        async with httpx.AsyncClient(base_url=server.base_url, limits=limits) as c:
+            await _timed(lambda i: case.call(c, i), warmup)
+            per_worker = max(1, iterations // concurrency)
+            started = time.perf_counter_ns()
+            chunks = await asyncio.gather(
+                *(
+                    _timed(
+                        lambda i: case.call(c, i),
+                        per_worker,
+                        offset=warmup + worker * per_worker,
+                    )
+                    for worker in range(concurrency)
+                )
+            )
+            elapsed = time.perf_counter_ns() - started
+    return _summarize(case.name, [s for chunk in chunks for s in chunk], elapsed)
+
+
+def load_baseline(path: Path) -> dict[str, dict]:
+    """
+    Loads a baseline file, returning an empty baseline if it does not exist.
+    """
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def save_baseline(path: Path, results: list[Result]) -> None:
+    """
+    Writes results as the new baseline, keyed by case name.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {result.name: asdict(result) for result in results}
+    path.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n")
+
+
+def compare(
+    results: list[Result],
+    baseline: dict[str, dict],
+    threshold: float,
+    require_all: bool = True,
+) -> list[str]:
+    """
+    Finds cases whose mean latency regressed beyond the threshold.
+
+    Args:
+        results (list[Result]): Freshly measured results.
+        baseline (dict[str, dict]): Baseline keyed by case name.
+        threshold (float): Allowed relative slowdown, e.g. 0.15 for 15%.
+        require_all (bool): Also report baseline cases that did not run.
+
+    Returns:
+        list[str]: One message per regressed or missing case. Empty if none.
+    """
+    regressions = []
+    if require_all:
+        measured = {result.name for result in results}
+        regressions.extend(
+            f"{name}: in the baseline but did not run"
+            for name in sorted(baseline.keys() - measured)
+        )
+    for result in results:
+        previous = baseline.get(result.name)
+        if previous is None:
+            continue
+        limit = previous["mean_us"] * (1 + threshold)
+        if result.mean_us > limit:
+            change = result.mean_us / previous["mean_us"] - 1
+            regressions.append(
+                f"{result.name}: mean {result.mean_us}us vs baseline "
+                f"{previous['mean_us']}us (+{change:.1%} > {threshold:.0%})"
+            )
+    return regressions
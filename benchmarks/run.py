@@ -0,0 +1,133 @@
+# Copyright 2025 Mohammadjavad Morady
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Runs the benchmark suite and gates it against a stored JSON baseline.
+
+    python -m benchmarks.run                      # in-process, compare to baseline
+    python -m benchmarks.run --save               # record a new baseline
+    python -m benchmarks.run --mode uvicorn -c 32 # load a real uvicorn server
+    python -m benchmarks.run -k jwt --threshold 0.25
+
+Baselines are host specific; record one on the machine that runs the gate.
+The process exits with status 1 when any case regresses past the threshold,
+when a suite cannot be loaded, or when a baseline case did not run. Pass
+--allow-skip to tolerate suites that cannot be loaded on this host.
+"""
+
+import argparse
+import asyncio
+import importlib
+import sys
+import traceback
+from pathlib import Path
+
+from benchmarks.harness import (
+    BASELINE_DIR,
+    compare,
+    load_baseline,
+    run_inprocess,
+    run_uvicorn,
+    save_baseline,
+)
+
+SUITES = (
+    "benchmarks.bench_jwt",
+    "benchmarks.bench_forms",
+    "benchmarks.bench_templates",
+    "benchmarks.bench_users",
+    "benchmarks.bench_grpc",
+)
+
+
+def _collect(keyword: str | None) -> tuple[list, list[str]]:
+    collected, failed = [], []
+    for suite in SUITES:
+        if keyword and keyword not in suite:
+            continue
+        try:
+            module = importlib.import_module(suite)
+            collected.extend(module.cases())
+        except Exception:
+            print(f"FAILED {suite}: could not be loaded", file=sys.stderr)
+            traceback.print_exc(limit=1)
+            failed.append(suite)
+    return collected, failed
+
+
+async def _run(args, cases: list) -> list:
+    results = []
+    for case in cases:
+        if args.mode == "uvicorn":
+            result = await run_uvicorn(
+                case, args.iterations, args.warmup, args.concurrency
+            )
+        else:
+            result = await run_inprocess(case, args.iterations, args.warmup)
+        print(
+            f"{result.name:<28} {result.ops_per_sec:>10.1f} ops/s "
+            f"mean {result.mean_us:>9.1f}us  p50 {result.p50_us:>9.1f}us  "
+            f"p99 {result.p99_us:>9.1f}us"
+        )
+        results.append(result)
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--mode", choices=("inprocess", "uvicorn"), default="inprocess")
+    parser.add_argument("-n", "--iterations", type=int, default=500)
+    parser.add_argument("-w", "--warmup", type=int, default=50)
+    parser.add_argument("-c", "--concurrency", type=int, default=16)
+    parser.add_argument("-k", "--keyword", help="only run suites containing this")
+    parser.add_argument("--threshold", type=float, default=0.15)
+    parser.add_argument(
+        "--baseline", type=Path, help="baseline file (default per mode)"
+    )
+    parser.add_argument("--save", action="store_true", help="store as baseline")
+    parser.add_argument(
+        "--allow-skip",
+        action="store_true",
+        help="skip suites that cannot be loaded instead of failing",
+    )
+    args = parser.parse_args(argv)
+
+    baseline_path = args.baseline or BASELINE_DIR / f"{args.mode}.json"
+    cases, failed = _collect(args.keyword)
+    if failed and not args.allow_skip:
+        print(f"{len(failed)} suite(s) could not be loaded", file=sys.stderr)
+        return 1
+    results = asyncio.run(_run(args, cases))
+
+    if args.save:
+        save_baseline(baseline_path, results)
+        print(f"baseline written to {baseline_path}")
+        return 0
+
+    baseline = load_baseline(baseline_path)
+    if not baseline:
+        print(f"no baseline at {baseline_path}; run with --save to record one")
+        return 0
+
+    # A keyword runs a subset on purpose, and skipped suites were allowed, so
+    # only a full run requires every baseline case to be present.
+    require_all = not args.keyword and not failed
+    regressions = compare(results, baseline, args.threshold, require_all)
+    for message in regressions:
+        print(f"REGRESSION {message}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
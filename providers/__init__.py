@@ -0,0 +1,60 @@
+# Copyright 2025 Mohammadjavad Morady
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+The things inside this are used as a library.
+
+Importing `providers` is cheap: the public names below are resolved on first
+attribute access (PEP 562), so FastAPI, pydantic, Jinja2 and PyJWT are only
+imported by the providers that are actually used.
+
+>>> from providers import JWTAuth  # imports FastAPI and PyJWT only now
+"""
+
+import importlib
+
+_LAZY_ATTRIBUTES = {
+    "AuthStrategy": "providers.auth.strategy.auth_strategy",
+    "JWTAuth": "providers.auth.methods.auth_jwt",
+    "DataStrategy": "providers.form.strategy.fs",
+    "FormDataStrategy": "providers.form.methods.data_strategies",
+    "JSONDataStrategy": "providers.form.methods.data_strategies",
+    "DynamicForm": "providers.form.methods.forms",
+    "build_form_class": "providers.form.methods.forms",
+    "create_field": "providers.form.methods.forms",
+    "AbstractTemplateLoader": "providers.template_loader.strategy.jinja_strategy",
+    "JinjaTemplateLoader": "providers.template_loader.methods.jinja_loader",
+    "CostProbe": "providers.hpc.strategy.hpc_strategy",
+    "CostBudget": "providers.hpc.methods.power_check",
+    "HardwarePowerCheck": "providers.hpc.methods.power_check",
+    "RECORDER": "providers.instrumentation.methods.recorder",
+    "EVENTS": "providers.instrumentation.methods.events",
+    "UpstreamClient": "providers.transport.strategy.transport_strategy",
+    "PooledUpstreamClient": "providers.transport.methods.pooled_client",
+}
+
+__all__ = sorted(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,336 @@
+# Copyright 2025 Mohammadjavad Morady
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module implements admission control for ASGI applications. Each route gets
+a concurrency limit and a bounded, priority-ordered wait queue; requests that
+cannot be admitted in time are shed early with 429 or 503 and a Retry-After
+header instead of piling up behind blocking work.
+"""
+
+import asyncio
+import heapq
+import itertools
+import json
+import math
+import time
+from typing import TYPE_CHECKING, Callable
+
+from starlette.routing import compile_path
+
+from providers.admission.strategy.limit_strategy import ConcurrencyLimit
+
+if TYPE_CHECKING:
+    from providers.auth.methods.auth_jwt import JWTAuth
+
+
+class Rejected(Exception):
+    """
+    Raised when a request is not admitted.
+
+    Attributes:
+        status (int): 429 when the request lost its place to a higher priority
+                      class, 503 when the route is saturated.
+        retry_after (int): Seconds the client should wait before retrying.
+    """
+
+    def __init__(self, status: int, retry_after: int):
+        super().__init__(status, retry_after)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class RouteLimiter:
+    """
+    Concurrency limiter with a bounded priority wait queue for one route.
+
+    Lower priority numbers are more important. When the queue is full, a more
+    important request evicts the least important waiter.
+
+    Attributes:
+        limit (ConcurrencyLimit): Algorithm deciding the concurrency limit.
+        max_queue (int): Maximum number of waiting requests.
+        queue_timeout (float): Seconds a request may wait before being shed.
+        in_flight (int): Requests currently running.
+    """
+
+    def __init__(
+        self, limit: ConcurrencyLimit, max_queue: int = 50, queue_timeout: float = 1.0
+    ):
+        self.limit = limit
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0
+        self._queued = 0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._avg_latency = 0.0
+
+    @property
+    def queued(self) -> int:
+        return self._queued
+
+    def retry_after(self) -> int:
+        """
+        Estimates when capacity frees up, from the average latency.
+        """
+        pending = (self._queued + 1) / max(1, self.limit.limit)
+        return max(1, math.ceil(self._avg_latency * pending))
+
+    def _evict_least_important(self, priority: int) -> bool:
+        live = [w for w in self._waiters if not w[2].done()]
+        if not live:
+            return False
+        victim = max(live, key=lambda w: (w[0], w[1]))
+        if victim[0] <= priority:
+            return False
+        victim[2].set_exception(Rejected(429, self.retry_after()))
+        self._queued -= 1
+        return True
+
+    async def acquire(self, priority: int | Callable[[], int]) -> int:
+        """
+        Waits for a slot.
+
+        Args:
+            priority (int | Callable[[], int]): Priority class of the request;
+                lower is more important. A callable is only evaluated when the
+                request cannot be admitted right away.
+
+        Returns:
+            int: Requests in flight when this one was admitted.
+
+        Raises:
+            Rejected: If the request is shed.
+        """
+        if self.in_flight < self.limit.limit and not self._queued:
+            self.in_flight += 1
+            return self.in_flight - 1
+        if callable(priority):
+            priority = priority()
+
+        if self._queued >= self.max_queue:
+            if not self._evict_least_important(priority):
+                best = min(
+                    (w[0] for w in self._waiters if not w[2].done()), default=priority
+                )
+                raise Rejected(503 if priority <= best else 429, self.retry_after())
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        self._queued += 1
+        try:
+            await asyncio.wait_for(future, self.queue_timeout)
+        except asyncio.TimeoutError:
+            # From Python 3.12 on, wait_for raises TimeoutError even when the
+            # future was settled in the same loop tick as the timeout. A
+            # granted slot must then be used and an eviction reported as such;
+            # both already took the request off the queue.
+            if future.done() and not future.cancelled():
+                if future.exception() is None:
+                    return self.in_flight - 1
+                raise future.exception()
+            self._queued -= 1
+            raise Rejected(503, self.retry_after())
+        except asyncio.CancelledError:
+            # The client went away: give back the queue place, or the slot if
+            # it was granted right before the cancellation.
+            if future.cancelled():
+                self._queued -= 1
+            elif future.exception() is None:
+                self.in_flight -= 1
+                self._admit_waiters()
+            raise
+        return self.in_flight - 1
+
+    def _admit_waiters(self) -> None:
+        while self._waiters and self.in_flight < self.limit.limit:
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue
+            self._queued -= 1
+            self.in_flight += 1
+            future.set_result(None)
+
+    def release(self, latency: float, in_flight: int, dropped: bool) -> None:
+        """
+        Frees a slot, adapts the limit and admits waiters that now fit.
+
+        Args:
+            latency (float): Time the request spent running, in seconds.
+            in_flight (int): Value returned by `acquire`.
+            dropped (bool): Whether the request failed.
+        """
+        self.in_flight -= 1
+        self._avg_latency += 0.1 * (latency - self._avg_latency)
+        self.limit.update(latency, in_flight, dropped)
+        self._admit_waiters()
+
+
+class PriorityClasses:
+    """
+    Maps a JWT claim to a priority class.
+
+    Attributes:
+        claim (str): Claim holding the class name, e.g. "tier".
+        classes (dict[str, int]): Class name to priority; lower is more important.
+        default (int): Priority of anonymous requests and unknown classes.
+    """
+
+    def __init__(
+        self,
+        claim: str = "tier",
+        classes: dict[str, int] | None = None,
+        default: int = 10,
+    ):
+        self.claim = claim
+        self.classes = classes if classes is not None else {}
+        self.default = default
+
+    def __call__(self, payload: dict | None) -> int:
+        if not payload:
+            return self.default
+        return self.classes.get(str(payload.get(self.claim)), self.default)
+
+
+class AdmissionControlMiddleware:
+    """
+    Admits requests per route through a `RouteLimiter` and sheds the rest.
+
+    The priority of a request comes from the JWT claims in
+    `request.state.user_payload`. It is only needed when a request has to
+    queue. Because this middleware runs before route dependencies, it then
+    verifies the bearer token itself with the given `JWTAuth` and stores the
+    claims in the request state, where `JWTAuth.authenticate` reuses them.
+
+    Attributes:
+        routes (list): Methods, compiled route patterns and their limiters.
+        classify (Callable[[dict | None], int]): Claims to priority mapping.
+    """
+
+    def __init__(
+        self,
+        app,
+        routes: dict[str | tuple[str, str], RouteLimiter],
+        jwt_auth: "JWTAuth | None" = None,
+        classify: Callable[[dict | None], int] | None = None,
+    ):
+        """
+        Initializes the middleware.
+
+        Args:
+            app: The wrapped ASGI application.
+            routes (dict[str | tuple[str, str], RouteLimiter]): Route path
+                templates (e.g. "/users/{user_id}"), or (method, path) pairs
+                such as ("GET", "/users/"), mapped to their limiter. A bare
+                path matches every method. Unmatched routes are not limited.
+            jwt_auth (JWTAuth | None): Used to read claims for prioritization.
+            classify (Callable | None): Claims to priority mapping. Defaults to
+                `PriorityClasses()`, which treats every request alike.
+        """
+        self.app = app
+        self.routes = []
+        for route, limiter in routes.items():
+            method, path = route if isinstance(route, tuple) else (None, route)
+            method = method.upper() if method else None
+            self.routes.append((method, compile_path(path)[0], limiter))
+        self.jwt_auth = jwt_auth
+        self.classify = classify if classify is not None else PriorityClasses()
+
+    def _limiter(self, method: str, path: str) -> RouteLimiter | None:
+        for route_method, pattern, limiter in self.routes:
+            if route_method in (None, method) and pattern.match(path):
+                return limiter
+        return None
+
+    def _payload(self, scope) -> dict | None:
+        state = scope.setdefault("state", {})
+        payload = state.get("user_payload")
+        if payload is not None or self.jwt_auth is None:
+            return payload
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                scheme, _, token = value.decode("latin-1").partition(" ")
+                if scheme.lower() != "bearer" or not token:
+                    return None
+                try:
+                    return self.jwt_auth.decode_for_request(state, token)
+                except Exception:
+                    # Invalid tokens are rejected later by the route itself.
+                    return None
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        limiter = self._limiter(scope["method"], scope["path"])
+        if limiter is None:
+            return await self.app(scope, receive, send)
+
+        try:
+            in_flight = await limiter.acquire(
+                lambda: self.classify(self._payload(scope))
+            )
+        except Rejected as rejected:
+            return await self._reject(send, rejected)
+
+        status = 500
+        started = time.monotonic()
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            limiter.release(time.monotonic() - started, in_flight, status >= 500)
+
+    @staticmethod
+    async def _reject(send, rejected: Rejected):
+        body = json.dumps(
+            {"detail": "Server is overloaded, retry later"}
+            if rejected.status == 503
+            else {"detail": "Too many requests for this priority class"}
+        ).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": rejected.status,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", str(rejected.retry_after).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+"""
+Example:
+    >>> from fastapi import FastAPI
+    >>> from providers.admission.methods.limits import AIMDLimit
+    >>> from providers.auth.methods.auth_jwt import JWTAuth
+
+    >>> app = FastAPI()
+    >>> app.add_middleware(
+    ...     AdmissionControlMiddleware,
+    ...     routes={"/users/{user_id}": RouteLimiter(AIMDLimit(target_latency=0.05))},
+    ...     jwt_auth=JWTAuth(secret_key="secret"),
+    ...     classify=PriorityClasses(claim="tier", classes={"internal": 0, "paid": 1}),
+    ... )
+"""
@@ -0,0 +1,112 @@
+# Copyright 2025 Mohammadjavad Morady
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module implements concurrency limit algorithms: a fixed limit, additive
+increase / multiplicative decrease (AIMD) against a latency target, and a
+gradient limit that compares short-term latency with the no-load latency.
+"""
+
+import math
+
+from providers.admission.strategy.limit_strategy import ConcurrencyLimit
+
+
+class FixedLimit(ConcurrencyLimit):
+    """
+    A limit that never changes.
+    """
+
+    def __init__(self, limit: int):
+        super().__init__(initial=limit, min_limit=limit, max_limit=limit)
+
+    def update(self, latency: float, in_flight: int, dropped: bool) -> None:
+        pass
+
+
+class AIMDLimit(ConcurrencyLimit):
+    """
+    Grows the limit by one while requests meet the latency target and cuts it
+    by `backoff` when one misses it or fails.
+
+    Attributes:
+        target_latency (float): Latency, in seconds, above which the limit shrinks.
+        backoff (float): Factor applied to the limit on a miss.
+    """
+
+    def __init__(
+        self,
+        initial: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 200,
+        target_latency: float = 0.1,
+        backoff: float = 0.9,
+    ):
+        super().__init__(initial, min_limit, max_limit)
+        self.target_latency = target_latency
+        self.backoff = backoff
+
+    def update(self, latency: float, in_flight: int, dropped: bool) -> None:
+        if dropped or latency > self.target_latency:
+            self.limit = self._clamp(math.floor(self.limit * self.backoff))
+        elif in_flight * 2 >= self.limit:
+            # Only grow while the limit is actually being used.
+            self.limit = self._clamp(self.limit + 1)
+
+
+class GradientLimit(ConcurrencyLimit):
+    """
+    Scales the limit by the ratio of long-term to short-term latency, plus a
+    small queue allowance, so it shrinks as soon as requests start queueing
+    inside the application.
+
+    Attributes:
+        smoothing (float): Weight of a new sample in the short-term average.
+        tolerance (float): Latency growth tolerated before the limit shrinks,
+                           e.g. 1.5 allows 50% over the long-term average.
+    """
+
+    def __init__(
+        self,
+        initial: int = 20,
+        min_limit: int = 1,
+        max_limit: int = 200,
+        smoothing: float = 0.2,
+        tolerance: float = 1.5,
+        long_window: int = 600,
+    ):
+        super().__init__(initial, min_limit, max_limit)
+        self.smoothing = smoothing
+        self.tolerance = tolerance
+        self._long_decay = 1 / long_window
+        self._short_rtt: float | None = None
+        self._long_rtt: float | None = None
+        self._estimate = float(self.limit)
+
+    def update(self, latency: float, in_flight: int, dropped: bool) -> None:
+        if self._short_rtt is None:
+            self._short_rtt = self._long_rtt = latency
+            return
+        self._short_rtt += self.smoothing * (latency - self._short_rtt)
+        self._long_rtt += self._long_decay * (latency - self._long_rtt)
+        if dropped:
+            self._estimate *= 0.5
+        elif in_flight * 2 >= self._estimate:
+            gradient = max(
+                0.5,
+                min(1.0, self.tolerance * self._long_rtt / self._short_rtt),
+            )
+            self._estimate = self._estimate * gradient + math.sqrt(self._estimate)
+        self._estimate = max(self.min_limit, min(self.max_limit, self._estimate))
+        self.limit = self._clamp(self._estimate)
@@ -0,0 +1,60 @@
+# Copyright 2025 Mohammadjavad Morady
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module defines the abstract concurrency limit used by admission control.
+A limit decides how many requests of a route may run at once and adapts that
+number from the latency of the requests that completed.
+"""
+
+from abc import ABC, abstractmethod
+
+
+class ConcurrencyLimit(ABC):
+    """
+    Abstract base class for concurrency limit algorithms.
+
+    Attributes:
+        limit (int): Current number of requests allowed to run concurrently.
+        min_limit (int): Lower bound of `limit`.
+        max_limit (int): Upper bound of `limit`.
+    """
+
+    def __init__(self, initial: int, min_limit: int = 1, max_limit: int = 1000):
+        """
+        Initializes the limit.
+
+        Args:
+            initial (int): Starting limit.
+            min_limit (int): Lower bound of the limit.
+            max_limit (int): Upper bound of the limit.
+        """
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.limit = max(min_limit, min(max_limit, initial))
+
+    def _clamp(self, value: float) -> int:
+        return int(max(self.min_limit, min(self.max_limit, value)))
+
+    @abstractmethod
+    def update(self, latency: float, in_flight: int, dropped: bool) -> None:
+        """
+        Adapts the limit after a request completed.
+
+        Args:
+            latency (float): Time the request spent running, in seconds.
+            in_flight (int): Requests running when this one was admitted.
+            dropped (bool): Whether the request failed (5xx or exception).
+        """
+        pass
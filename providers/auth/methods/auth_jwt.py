@@ -24,6 +24,7 @@ from fastapi import HTTPException, Request, status
 from jwt.exceptions import DecodeError, ExpiredSignatureError
 
 from providers.auth.strategy.auth_strategy import AuthStrategy
+from providers.instrumentation.methods.events import EVENTS
 
 
 class JWTAuth(AuthStrategy):
@@ -46,6 +47,47 @@ class JWTAuth(AuthStrategy):
         self.secret_key = secret_key
         self.algorithm = algorithm
 
+    def decode(self, token: str) -> dict:
+        """
+        Verifies a raw token and returns its payload.
+
+        Args:
+            token (str): The encoded JWT, without the "Bearer" scheme.
+
+        Returns:
+            dict: The verified payload.
+
+        Raises:
+            jwt.exceptions.PyJWTError: If the token is expired or invalid.
+        """
+        return jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+
+    def decode_for_request(self, state: dict, token: str) -> dict:
+        """
+        Verifies a token once per request.
+
+        The payload is stored in the request state together with the token and
+        this strategy, so a later call for the same request (e.g. admission
+        control first, then the route dependency) skips the signature check.
+
+        Args:
+            state (dict): The request state, `scope["state"]`.
+            token (str): The encoded JWT, without the "Bearer" scheme.
+
+        Returns:
+            dict: The verified payload.
+
+        Raises:
+            jwt.exceptions.PyJWTError: If the token is expired or invalid.
+        """
+        verified = state.get("jwt_verified")
+        if verified is not None and verified[0] is self and verified[1] == token:
+            return state["user_payload"]
+        payload = self.decode(token)
+        state["jwt_verified"] = (self, token)
+        state["user_payload"] = payload
+        return payload
+
     async def authenticate(self, request: Request) -> bool:
         """
         Authenticates the request based on the JWT found in the Authorization header.
@@ -80,8 +122,8 @@ class JWTAuth(AuthStrategy):
             return False
 
         try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
-            request.state.user_payload = payload  # Store payload in request state
+            # Stores the payload in the request state
+            self.decode_for_request(request.scope.setdefault("state", {}), token)
             return True
         except ExpiredSignatureError:
             raise HTTPException(
@@ -96,7 +138,12 @@ class JWTAuth(AuthStrategy):
                 headers={"WWW-Authenticate": "Bearer"},
             )
         except Exception as e:
-            print(f"JWT Verification Error: {e}")
+            EVENTS.emit(
+                "jwt.verification_error",
+                error=type(e).__name__,
+                detail=str(e),
+                algorithm=self.algorithm,
+            )
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Internal server error during token verification",
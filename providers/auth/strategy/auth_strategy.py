@@ -19,11 +19,17 @@ and its algorithms come from the library.
 """
 
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
-from fastapi import Request
+from providers.instrumentation.methods.recorder import InstrumentedStrategy
 
+if TYPE_CHECKING:
+    from fastapi import Request
+
+
+class AuthStrategy(InstrumentedStrategy, ABC):
+    __instrumented_methods__ = {"authenticate": "auth.authenticate"}
 
-class AuthStrategy(ABC):
     @abstractmethod
-    async def authenticate(self, request: Request) -> bool:
+    async def authenticate(self, request: "Request") -> bool:
         pass
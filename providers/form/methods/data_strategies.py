@@ -0,0 +1,77 @@
+# Copyright 2025 Mohammadjavad Morady
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module implements the data extraction strategies for form data and JSON
+payloads. Their `extract` methods are annotated with FastAPI's `Request`, so
+they can be used directly as dependencies, e.g. `Depends(strategy.extract)`.
+"""
+
+from fastapi import Request
+
+from providers.form.strategy.fs import DataStrategy
+
+
+class FormDataStrategy(DataStrategy):
+    """
+    Extracts data from a FastAPI request's form data.
+
+    Typically used when handling form submissions (e.g., from HTML forms).
+    """
+
+    async def extract(self, request: Request) -> dict:
+        """
+        Extracts form data from the request.
+
+        Args:
+            request (Request): The FastAPI request object.
+
+        Returns:
+            dict: Parsed form data as a dictionary.
+        """
+        form = await request.form()
+        return dict(form)
+
+
+class JSONDataStrategy(DataStrategy):
+    """
+    Extracts data from a FastAPI request's JSON body.
+
+    Typically used when clients send JSON payloads in POST or PUT requests.
+    """
+
+    async def extract(self, request: Request) -> dict:
+        """
+        Extracts JSON data from the request.
+
+        Args:
+            request (Request): The FastAPI request object.
+
+        Returns:
+            dict: Parsed JSON data as a dictionary.
+        """
+        return await request.json()
+
+
+"""
+Example:
+    >>> from fastapi import Depends, FastAPI
+
+    >>> app = FastAPI()
+    >>> json_strategy = JSONDataStrategy()
+
+    >>> @app.post("/submit/json/")
+    ... async def handle_json(data: dict = Depends(json_strategy.extract)):
+    ...     return {"parsed": data}
+"""
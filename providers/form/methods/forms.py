@@ -19,11 +19,37 @@ structures and their data sources are dynamically defined.
 """
 
 from abc import ABC
-from typing import Type
+from typing import TYPE_CHECKING, Iterator, Type
 
-from fastapi import Request
-from providers.data_teransfer.strategy.fs import DataStrategy
-from pydantic import BaseModel, Field, create_model
+from providers.form.strategy.fs import DataStrategy
+from providers.instrumentation.methods.recorder import RECORDER
+
+if TYPE_CHECKING:
+    from fastapi import Request
+    from pydantic import BaseModel
+
+
+class FormData:
+    """
+    Slotted container for validated form values.
+
+    `build_form_class` derives one subclass per form, with one slot per field,
+    so a record holds only the values: no per-instance dict, no raw request
+    data and no model instance. `DynamicForm.load` returns a new record per
+    call, so records are never shared between requests.
+    """
+
+    __slots__ = ()
+
+    def __iter__(self) -> Iterator[tuple[str, object]]:
+        for name in self.__slots__:
+            yield name, getattr(self, name, None)
+
+    def to_dict(self) -> dict:
+        """
+        Returns the values as a dictionary.
+        """
+        return dict(self)
 
 
 class DynamicForm(ABC):
@@ -34,9 +60,13 @@ class DynamicForm(ABC):
         model_cls (Type[BaseModel]): The Pydantic model class used for validation.
         strategy (DataStrategy): Strategy used to extract data from a request.
         data (BaseModel | None): An instance of the model class containing parsed data.
+        record (FormData | None): Record returned by the latest `load`.
     """
 
-    def __init__(self, model_cls: Type[BaseModel], strategy: DataStrategy):
+    __slots__ = ("model_cls", "strategy", "data", "record")
+    record_cls: Type[FormData] | None = None
+
+    def __init__(self, model_cls: Type["BaseModel"], strategy: DataStrategy):
         """
         Initializes a DynamicForm with the given model and data extraction strategy.
 
@@ -46,9 +76,10 @@ class DynamicForm(ABC):
         """
         self.model_cls = model_cls
         self.strategy = strategy
-        self.data: BaseModel | None = None
+        self.data: "BaseModel | None" = None
+        self.record: FormData | None = None
 
-    async def from_request(self, request: Request) -> BaseModel:
+    async def from_request(self, request: "Request") -> "BaseModel":
         """
         Extracts and parses data from an incoming request using the strategy.
 
@@ -59,9 +90,35 @@ class DynamicForm(ABC):
             BaseModel: The parsed and validated data.
         """
         raw_data = await self.strategy.extract(request)
-        self.data = self.model_cls(**raw_data)
+        with RECORDER.stage("form.validate", self.model_cls.__name__):
+            self.data = self.model_cls.model_validate(raw_data)
         return self.data
 
+    async def load(self, request: "Request") -> FormData:
+        """
+        Extracts and validates request data into the form's slotted record.
+
+        Unlike `from_request`, neither the raw data nor the model instance
+        outlives this call; only the field values are kept. Create one form
+        per request: the returned record belongs to this call, but the form
+        remembers only the latest record for `to_dict`.
+
+        Args:
+            request (Request): FastAPI request object.
+
+        Returns:
+            FormData: The record holding the validated values.
+        """
+        raw_data = await self.strategy.extract(request)
+        with RECORDER.stage("form.validate", self.model_cls.__name__):
+            values = self.model_cls.model_validate(raw_data).__dict__
+        record = self.record_cls()
+        for name in record.__slots__:
+            setattr(record, name, values[name])
+        self.record = record
+        self.data = None
+        return record
+
     def to_dict(self) -> dict:
         """
         Converts the validated data to a dictionary.
@@ -69,7 +126,9 @@ class DynamicForm(ABC):
         Returns:
             dict: Parsed form data as a dictionary. Empty if no data is set.
         """
-        return self.data.model_dump() if self.data else {}
+        if self.data is not None:
+            return self.data.model_dump()
+        return self.record.to_dict() if self.record is not None else {}
 
 
 def create_field(name: str, field_type: type, required: bool = True, default=None):
@@ -85,6 +144,8 @@ def create_field(name: str, field_type: type, required: bool = True, default=Non
     Returns:
         tuple: A name and a tuple containing the field type and Pydantic Field.
     """
+    from pydantic import Field
+
     metadata = Field(... if required else default)
     return name, (field_type, metadata)
 
@@ -101,9 +162,15 @@ def build_form_class(name: str, fields: list[tuple], strategy: DataStrategy):
     Returns:
         Type[DynamicForm]: A custom form class extending DynamicForm.
     """
+    from pydantic import create_model
+
     model = create_model(name, **dict(fields))
+    record = type(f"{name}Data", (FormData,), {"__slots__": tuple(model.model_fields)})
 
     class CustomForm(DynamicForm):
+        __slots__ = ()
+        record_cls = record
+
         def __init__(self):
             """
             Initializes the custom form using the dynamically generated model.
@@ -119,7 +186,7 @@ Example:
 
     >>> from fastapi import FastAPI, Request
     >>> from pydantic import constr
-    >>> from providers.data_teransfer.strategy.fs import JSONBodyStrategy
+    >>> from providers.form.methods.data_strategies import JSONDataStrategy
     >>> from your_module import create_field, build_form_class
 
     >>> app = FastAPI()
@@ -130,11 +197,16 @@ Example:
     ...     create_field("age", int, required=False, default=18),
     ... ]
 
-    >>> UserForm = build_form_class("UserForm", fields, strategy=JSONBodyStrategy())
+    >>> UserForm = build_form_class("UserForm", fields, strategy=JSONDataStrategy())
 
     >>> @app.post("/submit/")
     ... async def submit(request: Request):
     ...     form = UserForm()
     ...     data = await form.from_request(request)
     ...     return {"parsed_data": form.to_dict()}
+
+    >>> @app.post("/submit/lean/")
+    ... async def submit_lean(request: Request):
+    ...     record = await UserForm().load(request)
+    ...     return {"username": record.username}
 """
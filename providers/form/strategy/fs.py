@@ -13,25 +13,32 @@
 # limitations under the License.
 
 """
-This module defines a set of strategies for extracting data from FastAPI request objects.
-The strategy pattern allows interchangeable data sources such as form data or JSON payloads.
+This module defines the abstract strategy for extracting data from FastAPI request objects.
+The strategy pattern allows interchangeable data sources such as form data or JSON payloads;
+the form and JSON implementations live in `providers.form.methods.data_strategies`.
 """
 
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
-from fastapi import Request
+from providers.instrumentation.methods.recorder import InstrumentedStrategy
 
+if TYPE_CHECKING:
+    from fastapi import Request
 
-class DataStrategy(ABC):
+
+class DataStrategy(InstrumentedStrategy, ABC):
     """
     Abstract base class that defines the interface for data extraction strategies.
 
     Subclasses must implement the `extract` method to define how data is extracted
-    from a FastAPI request.
+    from a FastAPI request. Calls are timed as the "data.extract" stage.
     """
 
+    __instrumented_methods__ = {"extract": "data.extract"}
+
     @abstractmethod
-    async def extract(self, request: Request) -> dict:
+    async def extract(self, request: "Request") -> dict:
         """
         Extracts data from a FastAPI request object.
 
@@ -44,45 +51,14 @@ class DataStrategy(ABC):
         pass
 
 
-class FormDataStrategy(DataStrategy):
-    """
-    Extracts data from a FastAPI request's form data.
-
-    Typically used when handling form submissions (e.g., from HTML forms).
-    """
-
-    async def extract(self, request: Request) -> dict:
-        """
-        Extracts form data from the request.
-
-        Args:
-            request (Request): The FastAPI request object.
-
-        Returns:
-            dict: Parsed form data as a dictionary.
-        """
-        form = await request.form()
-        return dict(form)
+def __getattr__(name: str):
+    # The concrete strategies annotate `request` with FastAPI's Request, which
+    # FastAPI needs at runtime; they live in a module that imports it.
+    if name in ("FormDataStrategy", "JSONDataStrategy"):
+        from providers.form.methods import data_strategies
 
-
-class JSONDataStrategy(DataStrategy):
-    """
-    Extracts data from a FastAPI request's JSON body.
-
-    Typically used when clients send JSON payloads in POST or PUT requests.
-    """
-
-    async def extract(self, request: Request) -> dict:
-        """
-        Extracts JSON data from the request.
-
-        Args:
-            request (Request): The FastAPI request object.
-
-        Returns:
-            dict: Parsed JSON data as a dictionary.
-        """
-        return await request.json()
+        return getattr(data_strategies, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 """
@@ -91,7 +67,10 @@ Example:
 
     >>> from fastapi import FastAPI, Request
     >>> from pydantic import BaseModel
-    >>> from your_module import JSONDataStrategy, FormDataStrategy
+    >>> from providers.form.methods.data_strategies import (
+    ...     FormDataStrategy,
+    ...     JSONDataStrategy,
+    ... )
 
     >>> app = FastAPI()
 
@@ -0,0 +1,330 @@
+# Copyright 2025 Mohammadjavad Morady
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module implements the hardware power check (hpc). It micro-benchmarks each
+module of a composition on the host, builds a per-module cost profile and then
+accepts, degrades or rejects the composition against a per-request budget.
+"""
+
+import logging
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+
+from providers.hpc.strategy.hpc_strategy import CostProbe
+
+logger = logging.getLogger(__name__)
+
+ACCEPT = "accept"
+DEGRADE = "degrade"
+REJECT = "reject"
+
+
+@dataclass(frozen=True)
+class CostProfile:
+    """
+    Measured per-invocation cost of a single module.
+
+    Attributes:
+        name (str): Name of the measured module.
+        required (bool): Whether the module is mandatory for the composition.
+        iterations (int): Number of measured invocations.
+        cpu_ns (int): Mean CPU time per invocation, in nanoseconds.
+        p99_ns (int): 99th percentile wall time per invocation, in nanoseconds.
+        alloc_bytes (int): Mean peak memory allocated per invocation, in bytes.
+    """
+
+    name: str
+    required: bool
+    iterations: int
+    cpu_ns: int
+    p99_ns: int
+    alloc_bytes: int
+
+
+@dataclass(frozen=True)
+class CostBudget:
+    """
+    Per-request budget a composition must fit in. A limit of None is unbounded.
+
+    Attributes:
+        cpu_ns (int | None): Maximum CPU time per request, in nanoseconds.
+        p99_ns (int | None): Maximum p99 wall time per request, in nanoseconds.
+        alloc_bytes (int | None): Maximum memory allocated per request, in bytes.
+    """
+
+    cpu_ns: int | None = None
+    p99_ns: int | None = None
+    alloc_bytes: int | None = None
+
+    def exceeded_by(self, cpu_ns: int, p99_ns: int, alloc_bytes: int) -> list[str]:
+        """
+        Lists the budget dimensions exceeded by the given totals.
+
+        Returns:
+            list[str]: Names of the exceeded dimensions. Empty if within budget.
+        """
+        exceeded = []
+        if self.cpu_ns is not None and cpu_ns > self.cpu_ns:
+            exceeded.append("cpu_ns")
+        if self.p99_ns is not None and p99_ns > self.p99_ns:
+            exceeded.append("p99_ns")
+        if self.alloc_bytes is not None and alloc_bytes > self.alloc_bytes:
+            exceeded.append("alloc_bytes")
+        return exceeded
+
+
+@dataclass(frozen=True)
+class CompositionDecision:
+    """
+    Outcome of checking a composition against a budget.
+
+    Attributes:
+        verdict (str): One of "accept", "degrade" or "reject".
+        enabled (list[str]): Modules kept active.
+        disabled (list[str]): Optional modules disabled to fit the budget.
+        profiles (dict[str, CostProfile]): Measured profile of every module.
+        exceeded (list[str]): Budget dimensions exceeded by the full composition.
+    """
+
+    verdict: str
+    enabled: list[str]
+    disabled: list[str]
+    profiles: dict[str, CostProfile] = field(default_factory=dict)
+    exceeded: list[str] = field(default_factory=list)
+
+
+class CompositionRejected(RuntimeError):
+    """
+    Raised when even the required modules of a composition exceed the budget.
+    """
+
+    def __init__(self, decision: CompositionDecision):
+        self.decision = decision
+        super().__init__(
+            f"Composition exceeds budget on {', '.join(decision.exceeded)} "
+            f"with required modules {decision.enabled}"
+        )
+
+
+def _percentile(samples: list[int], q: float) -> int:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(q * len(ordered))) - 1))
+    return ordered[index]
+
+
+class HardwarePowerCheck:
+    """
+    Measures module costs on the host and gates compositions by a budget.
+
+    Module costs are summed per request, so the p99 of a composition is bounded
+    by the sum of the per-module p99 values.
+
+    Attributes:
+        budget (CostBudget): Per-request budget compositions must fit in.
+        iterations (int): Measured invocations per module.
+        warmup (int): Unmeasured invocations run before measuring.
+        profiles (dict[str, CostProfile]): Profiles measured so far, by name.
+    """
+
+    def __init__(self, budget: CostBudget, iterations: int = 200, warmup: int = 20):
+        """
+        Initializes the power check.
+
+        Args:
+            budget (CostBudget): Per-request budget compositions must fit in.
+            iterations (int): Measured invocations per module.
+            warmup (int): Unmeasured invocations run before measuring.
+        """
+        self.budget = budget
+        self.iterations = iterations
+        self.warmup = warmup
+        self.profiles: dict[str, CostProfile] = {}
+
+    async def profile(self, probe: CostProbe) -> CostProfile:
+        """
+        Micro-benchmarks a single module and records its profile.
+
+        Args:
+            probe (CostProbe): Probe driving the module under measurement.
+
+        Returns:
+            CostProfile: The measured cost of one invocation.
+        """
+        await probe.setup()
+        for _ in range(self.warmup):
+            await probe.run()
+
+        wall_samples = []
+        cpu_start = time.process_time_ns()
+        for _ in range(self.iterations):
+            started = time.perf_counter_ns()
+            await probe.run()
+            wall_samples.append(time.perf_counter_ns() - started)
+        cpu_total = time.process_time_ns() - cpu_start
+
+        # Allocation tracing slows every allocation down, so it gets its own
+        # pass instead of skewing the timings above.
+        alloc_runs = max(1, self.iterations // 10)
+        tracing = tracemalloc.is_tracing()
+        if not tracing:
+            tracemalloc.start()
+        try:
+            alloc_total = 0
+            for _ in range(alloc_runs):
+                baseline = tracemalloc.get_traced_memory()[0]
+                tracemalloc.reset_peak()
+                await probe.run()
+                alloc_total += tracemalloc.get_traced_memory()[1] - baseline
+        finally:
+            if not tracing:
+                tracemalloc.stop()
+
+        profile = CostProfile(
+            name=probe.name,
+            required=probe.required,
+            iterations=self.iterations,
+            cpu_ns=cpu_total // self.iterations,
+            p99_ns=_percentile(wall_samples, 0.99),
+            alloc_bytes=alloc_total // alloc_runs,
+        )
+        self.profiles[probe.name] = profile
+        logger.info(
+            "hpc profile %s: cpu=%dns p99=%dns alloc=%dB",
+            profile.name,
+            profile.cpu_ns,
+            profile.p99_ns,
+            profile.alloc_bytes,
+        )
+        return profile
+
+    def _totals(self, names: list[str]) -> tuple[int, int, int]:
+        profiles = [self.profiles[name] for name in names]
+        return (
+            sum(p.cpu_ns for p in profiles),
+            sum(p.p99_ns for p in profiles),
+            sum(p.alloc_bytes for p in profiles),
+        )
+
+    def decide(self, names: list[str]) -> CompositionDecision:
+        """
+        Checks already profiled modules against the budget.
+
+        Optional modules are disabled one at a time, most expensive first,
+        until the remaining composition fits. If the required modules alone
+        do not fit, the composition is rejected.
+
+        Args:
+            names (list[str]): Names of the profiled modules in the composition.
+
+        Returns:
+            CompositionDecision: The verdict and the enabled/disabled modules.
+        """
+        profiles = {name: self.profiles[name] for name in names}
+        exceeded = self.budget.exceeded_by(*self._totals(names))
+        enabled = list(names)
+        disabled: list[str] = []
+
+        if not exceeded:
+            verdict = ACCEPT
+        else:
+            optional = sorted(
+                (p for p in profiles.values() if not p.required),
+                key=lambda p: (p.p99_ns, p.cpu_ns, p.alloc_bytes),
+                reverse=True,
+            )
+            for candidate in optional:
+                if not self.budget.exceeded_by(*self._totals(enabled)):
+                    break
+                enabled.remove(candidate.name)
+                disabled.append(candidate.name)
+            fits = not self.budget.exceeded_by(*self._totals(enabled))
+            verdict = DEGRADE if fits else REJECT
+
+        decision = CompositionDecision(
+            verdict=verdict,
+            enabled=enabled,
+            disabled=disabled,
+            profiles=profiles,
+            exceeded=exceeded,
+        )
+        cpu_ns, p99_ns, alloc_bytes = self._totals(enabled)
+        log = logger.warning if verdict != ACCEPT else logger.info
+        log(
+            "hpc decision %s: enabled=%s disabled=%s exceeded=%s "
+            "cpu=%dns p99=%dns alloc=%dB budget=%s",
+            verdict,
+            enabled,
+            disabled,
+            exceeded,
+            cpu_ns,
+            p99_ns,
+            alloc_bytes,
+            self.budget,
+        )
+        return decision
+
+    async def check(
+        self, probes: list[CostProbe], enforce: bool = True
+    ) -> CompositionDecision:
+        """
+        Profiles every module of a composition and decides whether it may run.
+
+        Intended to be awaited once at application startup.
+
+        Args:
+            probes (list[CostProbe]): One probe per module of the composition.
+            enforce (bool): Raise when the composition is rejected.
+
+        Returns:
+            CompositionDecision: The verdict and the enabled/disabled modules.
+
+        Raises:
+            CompositionRejected: If `enforce` is set and the required modules
+                                 alone exceed the budget.
+        """
+        for probe in probes:
+            await self.profile(probe)
+        decision = self.decide([probe.name for probe in probes])
+        if enforce and decision.verdict == REJECT:
+            raise CompositionRejected(decision)
+        return decision
+
+
+"""
+Example:
+    Gate the modules of an application at startup:
+
+    >>> from contextlib import asynccontextmanager
+    >>> from fastapi import FastAPI
+    >>> from providers.auth.methods.auth_jwt import JWTAuth
+    >>> from providers.hpc.methods.probes import AuthProbe, TemplateRenderProbe
+    >>> from providers.template_loader.methods.jinja_loader import JinjaTemplateLoader
+
+    >>> jwt_auth = JWTAuth(secret_key="secret")
+    >>> loader = JinjaTemplateLoader("templates")
+    >>> hpc = HardwarePowerCheck(CostBudget(p99_ns=2_000_000, alloc_bytes=256_000))
+
+    >>> @asynccontextmanager
+    ... async def lifespan(app: FastAPI):
+    ...     decision = await hpc.check([
+    ...         AuthProbe(jwt_auth, {"Authorization": f"Bearer {token}"}),
+    ...         TemplateRenderProbe(loader, "index.html", {}, required=False),
+    ...     ])
+    ...     app.state.enabled_modules = decision.enabled
+    ...     yield
+
+    >>> app = FastAPI(lifespan=lifespan)
+"""
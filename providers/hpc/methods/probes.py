@@ -0,0 +1,153 @@
+# Copyright 2025 Mohammadjavad Morady
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides cost probes for the built-in providers. Each probe drives
+the provider through a synthetic in-memory request so that its cost can be
+measured without a running server.
+"""
+
+from typing import TYPE_CHECKING, Dict, Type
+
+from fastapi import Request
+
+from providers.auth.strategy.auth_strategy import AuthStrategy
+from providers.hpc.strategy.hpc_strategy import CostProbe
+from providers.template_loader.strategy.jinja_strategy import AbstractTemplateLoader
+
+if TYPE_CHECKING:
+    from providers.form.methods.forms import DynamicForm
+
+
+def build_request(
+    method: str = "GET",
+    path: str = "/",
+    headers: Dict[str, str] | None = None,
+    body: bytes = b"",
+) -> Request:
+    """
+    Builds a FastAPI request object backed by an in-memory ASGI scope.
+
+    Args:
+        method (str): HTTP method of the request.
+        path (str): Request path.
+        headers (Dict[str, str] | None): Request headers.
+        body (bytes): Raw request body returned by the receive channel.
+
+    Returns:
+        Request: A request that can be passed directly to a provider.
+    """
+    raw_headers = [
+        (key.lower().encode("latin-1"), value.encode("latin-1"))
+        for key, value in (headers or {}).items()
+    ]
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "headers": raw_headers,
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return Request(scope, receive)
+
+
+class AuthProbe(CostProbe):
+    """
+    Measures one `authenticate` call of an authentication strategy.
+
+    Attributes:
+        auth (AuthStrategy): The strategy under measurement (e.g. JWTAuth).
+        headers (Dict[str, str]): Headers of the synthetic request.
+    """
+
+    def __init__(
+        self,
+        auth: AuthStrategy,
+        headers: Dict[str, str],
+        name: str = "auth",
+        required: bool = True,
+    ):
+        super().__init__(name=name, required=required)
+        self.auth = auth
+        self.headers = headers
+
+    async def run(self) -> None:
+        await self.auth.authenticate(build_request(headers=self.headers))
+
+
+class TemplateRenderProbe(CostProbe):
+    """
+    Measures one `render` call of a template loader.
+
+    Attributes:
+        loader (AbstractTemplateLoader): The loader under measurement.
+        template_name (str): Template rendered on every run.
+        context (Dict): Context passed to the template.
+    """
+
+    def __init__(
+        self,
+        loader: AbstractTemplateLoader,
+        template_name: str,
+        context: Dict,
+        name: str = "template",
+        required: bool = True,
+    ):
+        super().__init__(name=name, required=required)
+        self.loader = loader
+        self.template_name = template_name
+        self.context = context
+
+    async def run(self) -> None:
+        self.loader.render(self.template_name, self.context)
+
+
+class DynamicFormProbe(CostProbe):
+    """
+    Measures one `from_request` call (extraction and validation) of a form.
+
+    Attributes:
+        form_cls (Type[DynamicForm]): Form class built by `build_form_class`.
+        body (bytes): Raw request body submitted on every run.
+        content_type (str): Content type of the body.
+    """
+
+    def __init__(
+        self,
+        form_cls: Type["DynamicForm"],
+        body: bytes,
+        content_type: str = "application/x-www-form-urlencoded",
+        name: str = "form",
+        required: bool = True,
+    ):
+        super().__init__(name=name, required=required)
+        self.form_cls = form_cls
+        self.body = body
+        self.content_type = content_type
+
+    async def run(self) -> None:
+        request = build_request(
+            method="POST",
+            headers={
+                "content-type": self.content_type,
+                "content-length": str(len(self.body)),
+            },
+            body=self.body,
+        )
+        await self.form_cls().from_request(request)
@@ -0,0 +1,59 @@
+# Copyright 2025 Mohammadjavad Morady
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module defines the abstract probe used by the hardware power check (hpc).
+A probe performs exactly one representative invocation of a provider so that
+its time and space cost can be measured on the host machine.
+"""
+
+from abc import ABC, abstractmethod
+
+
+class CostProbe(ABC):
+    """
+    Abstract base class for measuring the per-request cost of a single module.
+
+    Subclasses must implement `run`, which performs one unit of work exactly as
+    a request would (e.g. one token verification or one template render).
+
+    Attributes:
+        name (str): Identifier of the measured module, used in profiles and logs.
+        required (bool): Whether a composition can still be served without this
+                         module. Optional modules may be disabled to fit a budget.
+    """
+
+    def __init__(self, name: str, required: bool = True):
+        """
+        Initializes the probe.
+
+        Args:
+            name (str): Identifier of the measured module.
+            required (bool): Whether the module is mandatory for the composition.
+        """
+        self.name = name
+        self.required = required
+
+    async def setup(self) -> None:
+        """
+        Prepares any state needed by `run`. Called once before measurement.
+        """
+        pass
+
+    @abstractmethod
+    async def run(self) -> None:
+        """
+        Executes one representative invocation of the measured module.
+        """
+        pass
@@ -0,0 +1,96 @@
+# Copyright 2025 Mohammadjavad Morady
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module emits structured, rate-limited events from providers. Each event
+name has its own token bucket so that a burst of failures cannot flood the logs;
+suppressed occurrences are counted and reported with the next emitted event.
+"""
+
+import logging
+import time
+
+
+class EventLogger:
+    """
+    Emits structured log records, rate limited per event name.
+
+    Attributes:
+        logger (logging.Logger): Logger receiving the records.
+        rate (float): Sustained events per second allowed for each event name.
+        burst (int): Events allowed back to back before limiting kicks in.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger | None = None,
+        rate: float = 1.0,
+        burst: int = 10,
+    ):
+        """
+        Initializes the event logger.
+
+        Args:
+            logger (logging.Logger | None): Target logger. Defaults to
+                                            the "providers.events" logger.
+            rate (float): Sustained events per second per event name.
+            burst (int): Bucket capacity per event name.
+        """
+        self.logger = logger or logging.getLogger("providers.events")
+        self.rate = rate
+        self.burst = burst
+        self._buckets: dict[str, list] = {}
+
+    def emit(self, event: str, level: int = logging.WARNING, **fields) -> bool:
+        """
+        Emits an event unless its rate limit is exhausted.
+
+        The fields are attached to the log record as `record.event` and
+        `record.fields`, and rendered as key=value pairs in the message.
+
+        Args:
+            event (str): Event name, e.g. "jwt.verification_error".
+            level (int): Logging level of the record.
+            **fields: Structured data describing the event.
+
+        Returns:
+            bool: True if the event was logged, False if it was suppressed.
+        """
+        now = time.monotonic()
+        bucket = self._buckets.get(event)
+        if bucket is None:
+            # [tokens, last refill, suppressed since last emit]
+            bucket = self._buckets[event] = [float(self.burst), now, 0]
+        bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+        bucket[1] = now
+        if bucket[0] < 1:
+            bucket[2] += 1
+            return False
+        bucket[0] -= 1
+
+        if bucket[2]:
+            fields["suppressed"] = bucket[2]
+            bucket[2] = 0
+        message = " ".join(f"{key}={value!r}" for key, value in fields.items())
+        self.logger.log(
+            level,
+            "%s %s",
+            event,
+            message,
+            extra={"event": event, "fields": fields},
+        )
+        return True
+
+
+EVENTS = EventLogger()
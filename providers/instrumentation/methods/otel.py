@@ -0,0 +1,82 @@
+# Copyright 2025 Mohammadjavad Morady
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module provides an optional OpenTelemetry exporter for provider stages.
+The `opentelemetry-api` package is only needed when the exporter is created.
+"""
+
+from providers.instrumentation.strategy.instrumentation_strategy import (
+    MetricsExporter,
+)
+
+
+class OpenTelemetryExporter(MetricsExporter):
+    """
+    Forwards stage observations to OpenTelemetry histogram and up-down counter
+    instruments.
+
+    Attributes:
+        duration (Histogram): Stage duration instrument, in seconds.
+        allocations (UpDownCounter): Net retained memory blocks instrument.
+    """
+
+    def __init__(self, meter_name: str = "providers", meter_provider=None):
+        """
+        Initializes the exporter with a meter from the given provider.
+
+        Args:
+            meter_name (str): Name of the meter. Defaults to "providers".
+            meter_provider: OpenTelemetry meter provider. Uses the global
+                            provider when omitted.
+
+        Raises:
+            ImportError: If `opentelemetry-api` is not installed.
+        """
+        try:
+            from opentelemetry import metrics
+        except ImportError as e:
+            raise ImportError(
+                "OpenTelemetryExporter requires the 'opentelemetry-api' package"
+            ) from e
+
+        meter = metrics.get_meter(meter_name, meter_provider=meter_provider)
+        self.duration = meter.create_histogram(
+            "providers.stage.duration",
+            unit="s",
+            description="Time spent in provider stages.",
+        )
+        # Net block deltas go negative when a stage frees more than it
+        # allocates, so they are summed as-is like the Prometheus gauge.
+        self.allocations = meter.create_up_down_counter(
+            "providers.stage.net_alloc_blocks",
+            description="Net memory blocks retained by provider stages.",
+        )
+
+    def record(
+        self, stage: str, strategy: str, duration_ns: int, alloc_blocks: int
+    ) -> None:
+        attributes = {"stage": stage, "strategy": strategy}
+        self.duration.record(duration_ns / 1e9, attributes)
+        if alloc_blocks:
+            self.allocations.add(alloc_blocks, attributes)
+
+
+"""
+Example:
+    >>> from providers.instrumentation.methods.recorder import RECORDER
+
+    >>> RECORDER.add_exporter(OpenTelemetryExporter())
+    >>> RECORDER.enable()
+"""
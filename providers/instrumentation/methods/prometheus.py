@@ -0,0 +1,103 @@
+# Copyright 2025 Mohammadjavad Morady
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module exposes the recorder's stage histograms in the Prometheus text
+exposition format, either as a string or through a FastAPI route.
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from providers.instrumentation.methods.recorder import RECORDER, Recorder
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def render_prometheus_text(recorder: Recorder = RECORDER) -> str:
+    """
+    Renders every stage histogram in the Prometheus text format.
+
+    Args:
+        recorder (Recorder): Recorder whose histograms are rendered.
+
+    Returns:
+        str: The exposition text.
+    """
+    lines = [
+        "# HELP providers_stage_duration_seconds Time spent in provider stages.",
+        "# TYPE providers_stage_duration_seconds histogram",
+    ]
+    allocations = [
+        "# HELP providers_stage_net_alloc_blocks Net memory blocks retained by "
+        "provider stages; negative when stages free more than they allocate.",
+        "# TYPE providers_stage_net_alloc_blocks gauge",
+    ]
+    for (stage, strategy), histogram in sorted(recorder.stages.items()):
+        labels = f'stage="{stage}",strategy="{strategy}"'
+        cumulative = 0
+        for bound, count in zip(histogram.bounds, histogram.counts):
+            cumulative += count
+            lines.append(
+                f"providers_stage_duration_seconds_bucket"
+                f'{{{labels},le="{bound / 1e9:g}"}} {cumulative}'
+            )
+        lines.append(
+            f'providers_stage_duration_seconds_bucket{{{labels},le="+Inf"}} '
+            f"{histogram.count}"
+        )
+        lines.append(
+            f"providers_stage_duration_seconds_sum{{{labels}}} "
+            f"{histogram.sum_ns / 1e9:.9f}"
+        )
+        lines.append(
+            f"providers_stage_duration_seconds_count{{{labels}}} {histogram.count}"
+        )
+        allocations.append(
+            f"providers_stage_net_alloc_blocks{{{labels}}} {histogram.alloc_blocks}"
+        )
+    return "\n".join(lines + allocations) + "\n"
+
+
+def build_metrics_router(path: str = "/metrics", recorder: Recorder = RECORDER):
+    """
+    Builds a router serving the Prometheus text endpoint.
+
+    Args:
+        path (str): Path of the endpoint. Defaults to "/metrics".
+        recorder (Recorder): Recorder whose histograms are served.
+
+    Returns:
+        APIRouter: A router to include in the application.
+    """
+    router = APIRouter()
+
+    @router.get(path, include_in_schema=False)
+    async def metrics() -> PlainTextResponse:
+        return PlainTextResponse(
+            render_prometheus_text(recorder), media_type=CONTENT_TYPE
+        )
+
+    return router
+
+
+"""
+Example:
+    >>> from fastapi import FastAPI
+    >>> from providers.instrumentation.methods.recorder import RECORDER
+
+    >>> RECORDER.enable(track_allocations=True)
+    >>> app = FastAPI()
+    >>> app.include_router(build_metrics_router())
+"""
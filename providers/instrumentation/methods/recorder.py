@@ -0,0 +1,261 @@
+# Copyright 2025 Mohammadjavad Morady
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module implements request-scoped hot-path timers shared by the provider
+strategy base classes. Stages are timed with the monotonic nanosecond clock into
+preallocated histogram buckets. When the recorder is disabled an instrumented
+call costs a single attribute check.
+"""
+
+import functools
+import inspect
+import sys
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from providers.instrumentation.strategy.instrumentation_strategy import (
+    MetricsExporter,
+)
+
+# Upper bounds of the latency buckets, in nanoseconds (50us .. 1s).
+DEFAULT_BUCKETS_NS = (
+    50_000,
+    100_000,
+    250_000,
+    500_000,
+    1_000_000,
+    2_500_000,
+    5_000_000,
+    10_000_000,
+    25_000_000,
+    50_000_000,
+    100_000_000,
+    250_000_000,
+    500_000_000,
+    1_000_000_000,
+)
+
+
+class StageHistogram:
+    """
+    Fixed-bucket latency histogram for a single (stage, strategy) pair.
+
+    Attributes:
+        bounds (tuple[int, ...]): Upper bucket bounds in nanoseconds.
+        counts (list[int]): Per-bucket counts; the last slot is the +Inf bucket.
+        count (int): Total number of observations.
+        sum_ns (int): Sum of all observed durations, in nanoseconds.
+        alloc_blocks (int): Sum of net allocated memory blocks; may be negative.
+    """
+
+    __slots__ = ("bounds", "counts", "count", "sum_ns", "alloc_blocks")
+
+    def __init__(self, bounds: tuple[int, ...] = DEFAULT_BUCKETS_NS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum_ns = 0
+        self.alloc_blocks = 0
+
+    def observe(self, duration_ns: int, alloc_blocks: int = 0) -> None:
+        """
+        Adds one observation to the histogram.
+
+        Args:
+            duration_ns (int): Duration of the stage, in nanoseconds.
+            alloc_blocks (int): Net memory blocks allocated during the stage.
+        """
+        self.counts[bisect_left(self.bounds, duration_ns)] += 1
+        self.count += 1
+        self.sum_ns += duration_ns
+        self.alloc_blocks += alloc_blocks
+
+
+class Recorder:
+    """
+    Collects stage histograms and forwards observations to exporters.
+
+    Attributes:
+        enabled (bool): Whether instrumented calls are measured at all.
+        track_allocations (bool): Whether net allocated blocks are counted.
+        stages (dict[tuple[str, str], StageHistogram]): Histograms keyed by
+            (stage, strategy).
+        exporters (list[MetricsExporter]): Exporters receiving observations.
+    """
+
+    def __init__(self, bounds: tuple[int, ...] = DEFAULT_BUCKETS_NS):
+        self.enabled = False
+        self.track_allocations = False
+        self.bounds = bounds
+        self.stages: dict[tuple[str, str], StageHistogram] = {}
+        self.exporters: list[MetricsExporter] = []
+
+    def enable(self, track_allocations: bool = False) -> None:
+        """
+        Turns measurement on.
+
+        Args:
+            track_allocations (bool): Also count net allocated memory blocks.
+        """
+        self.track_allocations = track_allocations
+        self.enabled = True
+
+    def disable(self) -> None:
+        """
+        Turns measurement off. Collected histograms are kept.
+        """
+        self.enabled = False
+
+    def reset(self) -> None:
+        """
+        Drops every collected histogram.
+        """
+        self.stages.clear()
+
+    def add_exporter(self, exporter: MetricsExporter) -> None:
+        """
+        Registers an exporter that receives every observation.
+
+        Args:
+            exporter (MetricsExporter): The exporter to register.
+        """
+        self.exporters.append(exporter)
+
+    def observe(
+        self, stage: str, strategy: str, duration_ns: int, alloc_blocks: int = 0
+    ) -> None:
+        """
+        Records one observation of a stage.
+
+        Args:
+            stage (str): Name of the stage, e.g. "auth.authenticate".
+            strategy (str): Class name of the strategy that ran the stage.
+            duration_ns (int): Duration of the stage, in nanoseconds.
+            alloc_blocks (int): Net memory blocks allocated during the stage.
+        """
+        key = (stage, strategy)
+        histogram = self.stages.get(key)
+        if histogram is None:
+            histogram = self.stages[key] = StageHistogram(self.bounds)
+        histogram.observe(duration_ns, alloc_blocks)
+        for exporter in self.exporters:
+            exporter.record(stage, strategy, duration_ns, alloc_blocks)
+
+    @contextmanager
+    def stage(self, stage: str, strategy: str):
+        """
+        Times the enclosed block as one observation of a stage.
+
+        Args:
+            stage (str): Name of the stage.
+            strategy (str): Class name of the strategy that runs the stage.
+        """
+        if not self.enabled:
+            yield
+            return
+        blocks = sys.getallocatedblocks() if self.track_allocations else 0
+        started = time.monotonic_ns()
+        try:
+            yield
+        finally:
+            duration = time.monotonic_ns() - started
+            if self.track_allocations:
+                blocks = sys.getallocatedblocks() - blocks
+            self.observe(stage, strategy, duration, blocks)
+
+
+RECORDER = Recorder()
+
+# Stages being timed in the current context. An override that calls super()
+# runs the wrapped parent method too; only the outermost call is recorded.
+_ACTIVE_STAGES: ContextVar[frozenset[str]] = ContextVar(
+    "active_stages", default=frozenset()
+)
+
+
+def instrument(method, stage: str, recorder: Recorder = RECORDER):
+    """
+    Wraps a strategy method so each call is timed as a stage.
+
+    The wrapper keeps the signature and coroutine-ness of `method`, so it can
+    still be used as a FastAPI dependency. Nested calls of the same stage,
+    such as an override calling `super()`, are recorded once.
+
+    Args:
+        method: The unbound sync or async method to wrap.
+        stage (str): Name of the stage recorded for each call.
+        recorder (Recorder): Recorder receiving the observations.
+
+    Returns:
+        The wrapped method.
+    """
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            if not recorder.enabled:
+                return await method(self, *args, **kwargs)
+            active = _ACTIVE_STAGES.get()
+            if stage in active:
+                return await method(self, *args, **kwargs)
+            token = _ACTIVE_STAGES.set(active | {stage})
+            try:
+                with recorder.stage(stage, type(self).__name__):
+                    return await method(self, *args, **kwargs)
+            finally:
+                _ACTIVE_STAGES.reset(token)
+
+    else:
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not recorder.enabled:
+                return method(self, *args, **kwargs)
+            active = _ACTIVE_STAGES.get()
+            if stage in active:
+                return method(self, *args, **kwargs)
+            token = _ACTIVE_STAGES.set(active | {stage})
+            try:
+                with recorder.stage(stage, type(self).__name__):
+                    return method(self, *args, **kwargs)
+            finally:
+                _ACTIVE_STAGES.reset(token)
+
+    wrapper.__instrumented__ = True
+    return wrapper
+
+
+class InstrumentedStrategy:
+    """
+    Mixin for strategy base classes whose hot-path methods should be timed.
+
+    Base classes list the methods to time in `__instrumented_methods__`,
+    mapping method name to stage name. Every concrete subclass that defines
+    one of these methods gets it wrapped with `instrument` automatically.
+    """
+
+    __instrumented_methods__: dict[str, str] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name, stage in cls.__instrumented_methods__.items():
+            method = cls.__dict__.get(name)
+            if method is None or getattr(method, "__isabstractmethod__", False):
+                continue
+            if getattr(method, "__instrumented__", False):
+                continue
+            setattr(cls, name, instrument(method, stage))
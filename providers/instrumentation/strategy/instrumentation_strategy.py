@@ -0,0 +1,48 @@
+# Copyright 2025 Mohammadjavad Morady
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module defines the abstract exporter interface for provider instrumentation.
+Exporters receive every observation the recorder makes while it is enabled and
+forward it to an external metrics backend.
+"""
+
+from abc import ABC, abstractmethod
+
+
+class MetricsExporter(ABC):
+    """
+    Abstract base class for pushing stage observations to a metrics backend.
+
+    Pull-based backends (such as the Prometheus text endpoint) read the
+    recorder directly and do not need an exporter.
+    """
+
+    @abstractmethod
+    def record(
+        self, stage: str, strategy: str, duration_ns: int, alloc_blocks: int
+    ) -> None:
+        """
+        Records a single observation of an instrumented stage.
+
+        Args:
+            stage (str): Name of the stage, e.g. "auth.authenticate".
+            strategy (str): Class name of the strategy that ran the stage.
+            duration_ns (int): Monotonic duration of the stage, in nanoseconds.
+            alloc_blocks (int): Net memory blocks allocated during the stage,
+                                negative when the stage freed more blocks
+                                than it allocated. Zero when allocation
+                                tracking is off.
+        """
+        pass
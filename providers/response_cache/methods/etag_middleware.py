@@ -0,0 +1,291 @@
+# Copyright 2025 Mohammadjavad Morady
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module implements an ASGI middleware that caches GET responses with strong
+ETags. The ETag is hashed while the body streams out of the application, and a
+request whose If-None-Match matches a cached validator is answered with 304
+without calling the application (and so without rendering anything).
+"""
+
+import hashlib
+import time
+from dataclasses import dataclass
+
+from starlette.datastructures import Headers
+from starlette.routing import compile_path
+
+from providers.response_cache.methods.memory_cache import MemoryResponseCache
+from providers.response_cache.strategy.cache_strategy import (
+    CachedResponse,
+    ResponseCacheBackend,
+)
+
+UNSAFE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+VALIDATOR_HEADERS = frozenset({b"etag", b"cache-control", b"vary"})
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """
+    Caching policy of a route.
+
+    Attributes:
+        ttl (float): Seconds a response is served from the cache before the
+                     application is asked to render it again.
+        max_age (int): `max-age` sent to clients. Zero sends `no-cache`, so
+                       clients always revalidate with If-None-Match.
+        private (bool): Mark responses `private` instead of `public`. Private
+                        responses are per user, so `vary` must include
+                        "authorization" to keep users' entries apart.
+        vary (tuple[str, ...]): Request headers the response depends on, e.g.
+                                ("authorization",) for per-user responses.
+    """
+
+    ttl: float = 60.0
+    max_age: int = 0
+    private: bool = False
+    vary: tuple[str, ...] = ()
+
+    def __post_init__(self):
+        if self.private and not self.per_user:
+            raise ValueError(
+                "private cache policies must vary on the authorization header"
+            )
+
+    @property
+    def per_user(self) -> bool:
+        return any(name.lower() == "authorization" for name in self.vary)
+
+    @property
+    def cache_control(self) -> bytes:
+        scope = "private" if self.private else "public"
+        freshness = f"max-age={self.max_age}" if self.max_age else "no-cache"
+        return f"{scope}, {freshness}".encode()
+
+
+def invalidation_prefix(path: str) -> str:
+    """
+    Returns the first path segment, e.g. "/users" for "/users/1".
+    """
+    return "/" + path.lstrip("/").split("/", 1)[0]
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Checks an If-None-Match header against an entity tag (weak comparison).
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(",")
+    )
+
+
+class ResponseCacheMiddleware:
+    """
+    Caches GET responses of the configured routes and answers conditional
+    requests with 304.
+
+    Successful POST, PUT, PATCH and DELETE requests invalidate every entry
+    under the first path segment of their path (e.g. PUT /users/1 drops
+    /users/1, /users/ and /users/search/).
+
+    Attributes:
+        backend (ResponseCacheBackend): Storage of cached responses.
+        max_entry_bytes (int): Larger bodies are streamed through uncached.
+    """
+
+    def __init__(
+        self,
+        app,
+        policies: dict[str, CachePolicy],
+        backend: ResponseCacheBackend | None = None,
+        max_entry_bytes: int = 1024 * 1024,
+    ):
+        """
+        Initializes the middleware.
+
+        Args:
+            app: The wrapped ASGI application.
+            policies (dict[str, CachePolicy]): Route path templates (e.g.
+                "/users/{user_id}") mapped to their caching policy.
+            backend (ResponseCacheBackend | None): Response storage. Defaults to
+                a bounded in-process `MemoryResponseCache`.
+            max_entry_bytes (int): Largest body that is cached.
+        """
+        self.app = app
+        self.routes = [
+            (compile_path(path)[0], policy) for path, policy in policies.items()
+        ]
+        self.backend = backend if backend is not None else MemoryResponseCache()
+        self.max_entry_bytes = max_entry_bytes
+
+    def _policy(self, path: str) -> CachePolicy | None:
+        for pattern, policy in self.routes:
+            if pattern.match(path):
+                return policy
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        method = scope["method"]
+        if method in UNSAFE_METHODS:
+            return await self._invalidating(scope, receive, send)
+
+        policy = self._policy(scope["path"]) if method == "GET" else None
+        if policy is None:
+            return await self.app(scope, receive, send)
+
+        headers = Headers(scope=scope)
+        key = "{}?{}#{}".format(
+            scope["path"],
+            scope["query_string"].decode("latin-1"),
+            "|".join(headers.get(name, "") for name in policy.vary),
+        )
+        if_none_match = headers.get("if-none-match")
+
+        cached = self.backend.get(key)
+        if cached is not None and time.monotonic() - cached.stored_at < policy.ttl:
+            if etag_matches(if_none_match, cached.etag):
+                return await self._send_not_modified(send, cached.headers)
+            return await self._send(send, cached.status, cached.headers, cached.body)
+
+        await self._render(scope, receive, send, policy, key, if_none_match)
+
+    async def _render(self, scope, receive, send, policy, key, if_none_match):
+        # A write committed while this response renders may invalidate the
+        # prefix before the (now stale) body is stored; the generation tells.
+        prefix = invalidation_prefix(scope["path"])
+        generation = self.backend.generation(prefix)
+        hasher = hashlib.blake2b(digest_size=16)
+        chunks: list[bytes] = []
+        size = 0
+        start = None
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start, size, passthrough
+            if passthrough:
+                return await send(message)
+            if message["type"] == "http.response.start":
+                cache_control = Headers(raw=message.get("headers", [])).get(
+                    "cache-control", ""
+                )
+                # Responses the application marks private are only stored
+                # when entries are already kept apart per user.
+                if (
+                    message["status"] != 200
+                    or "no-store" in cache_control
+                    or ("private" in cache_control and not policy.per_user)
+                ):
+                    passthrough = True
+                    return await send(message)
+                start = message
+                return
+            if message["type"] != "http.response.body":
+                return await send(message)
+
+            body = message.get("body", b"")
+            hasher.update(body)
+            chunks.append(body)
+            size += len(body)
+            more_body = message.get("more_body", False)
+
+            if size > self.max_entry_bytes:
+                passthrough = True
+                await send(start)
+                return await send(
+                    {
+                        "type": "http.response.body",
+                        "body": b"".join(chunks),
+                        "more_body": more_body,
+                    }
+                )
+            if more_body:
+                return
+
+            etag = f'"{hasher.hexdigest()}"'
+            headers = [
+                (bytes(name), bytes(value))
+                for name, value in start.get("headers", [])
+                if name != b"etag"
+            ]
+            headers.append((b"etag", etag.encode()))
+            if not any(name == b"cache-control" for name, _ in headers):
+                headers.append((b"cache-control", policy.cache_control))
+            if policy.vary:
+                headers.append((b"vary", ", ".join(policy.vary).encode()))
+
+            content = b"".join(chunks)
+            if self.backend.generation(prefix) == generation:
+                self.backend.set(
+                    key, CachedResponse(etag, 200, headers, content, time.monotonic())
+                )
+            if etag_matches(if_none_match, etag):
+                return await self._send_not_modified(send, headers)
+            await self._send(send, 200, headers, content)
+
+        await self.app(scope, receive, send_wrapper)
+
+    async def _invalidating(self, scope, receive, send):
+        prefix = invalidation_prefix(scope["path"])
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                self.backend.invalidate(prefix)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    @staticmethod
+    async def _send(send, status, headers, body):
+        await send(
+            {"type": "http.response.start", "status": status, "headers": headers}
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    @staticmethod
+    async def _send_not_modified(send, headers):
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 304,
+                "headers": [h for h in headers if h[0] in VALIDATOR_HEADERS],
+            }
+        )
+        await send({"type": "http.response.body", "body": b""})
+
+
+"""
+Example:
+    >>> from fastapi import FastAPI
+    >>> from providers.template_loader.methods.jinja_loader import JinjaTemplateLoader
+
+    >>> app = FastAPI()
+    >>> loader = JinjaTemplateLoader("templates")
+
+    >>> @app.get("/")
+    ... async def index():
+    ...     return loader.render("index.html", {"name": "World"})
+
+    >>> app.add_middleware(
+    ...     ResponseCacheMiddleware,
+    ...     policies={"/": CachePolicy(ttl=300, max_age=60)},
+    ... )
+"""
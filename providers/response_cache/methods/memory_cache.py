@@ -0,0 +1,81 @@
+# Copyright 2025 Mohammadjavad Morady
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module implements a bounded, in-process LRU response cache shared by all
+requests served by one worker.
+"""
+
+from collections import OrderedDict
+
+from providers.response_cache.strategy.cache_strategy import (
+    CachedResponse,
+    ResponseCacheBackend,
+)
+
+
+class MemoryResponseCache(ResponseCacheBackend):
+    """
+    LRU response cache bounded by both entry count and total bytes.
+
+    Attributes:
+        max_entries (int): Maximum number of cached responses.
+        max_bytes (int): Maximum total size of cached responses, in bytes.
+        size (int): Current total size of cached responses, in bytes.
+    """
+
+    def __init__(self, max_entries: int = 4096, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Initializes an empty cache.
+
+        Args:
+            max_entries (int): Maximum number of cached responses.
+            max_bytes (int): Maximum total size of cached responses, in bytes.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._generations: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> CachedResponse | None:
+        response = self._entries.get(key)
+        if response is not None:
+            self._entries.move_to_end(key)
+        return response
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        if response.size > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.size -= previous.size
+        self._entries[key] = response
+        self.size += response.size
+        while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= evicted.size
+
+    def generation(self, prefix: str) -> int:
+        return self._generations.get(prefix, 0)
+
+    def invalidate(self, prefix: str) -> int:
+        self._generations[prefix] = self._generations.get(prefix, 0) + 1
+        stale = [key for key in self._entries if key.startswith(prefix)]
+        for key in stale:
+            self.size -= self._entries.pop(key).size
+        return len(stale)
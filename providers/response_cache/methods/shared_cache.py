@@ -0,0 +1,128 @@
+# Copyright 2025 Mohammadjavad Morady
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module implements a response cache stored in a `SharedKVSegment`, so that
+every uvicorn worker forked from the same parent sees the same entries and the
+same invalidations.
+
+Entries are stored in a plain binary layout (fixed header, length-prefixed
+etag and headers, raw body), never pickled, so that whoever can write to a
+segment file cannot run code in the workers reading it.
+"""
+
+import struct
+
+from providers.response_cache.strategy.cache_strategy import (
+    CachedResponse,
+    ResponseCacheBackend,
+)
+from providers.serving.methods.shared_kv import SharedKVSegment
+
+_ENTRY = struct.Struct("<dHHH")  # stored_at, status, etag length, header count
+_HEADER = struct.Struct("<HH")  # name length, value length
+# Paths start with "/", so generation keys are never dropped by `invalidate`.
+_GENERATION_KEY = "#generation:"
+
+
+def encode_response(response: CachedResponse) -> bytes:
+    """
+    Serializes a cached response to bytes.
+    """
+    etag = response.etag.encode("latin-1")
+    parts = [
+        _ENTRY.pack(
+            response.stored_at, response.status, len(etag), len(response.headers)
+        ),
+        etag,
+    ]
+    for name, value in response.headers:
+        parts.append(_HEADER.pack(len(name), len(value)))
+        parts.append(name)
+        parts.append(value)
+    parts.append(response.body)
+    return b"".join(parts)
+
+
+def decode_response(data: bytes) -> CachedResponse:
+    """
+    Parses bytes written by `encode_response`.
+
+    Raises:
+        ValueError: If the data is not a valid entry.
+    """
+    try:
+        stored_at, status, etag_len, count = _ENTRY.unpack_from(data)
+        offset = _ENTRY.size
+        etag = data[offset : offset + etag_len].decode("latin-1")
+        offset += etag_len
+        headers = []
+        for _ in range(count):
+            name_len, value_len = _HEADER.unpack_from(data, offset)
+            offset += _HEADER.size
+            name = bytes(data[offset : offset + name_len])
+            offset += name_len
+            headers.append((name, bytes(data[offset : offset + value_len])))
+            offset += value_len
+    except struct.error as e:
+        raise ValueError("malformed cache entry") from e
+    if offset > len(data) or len(etag) != etag_len:
+        raise ValueError("malformed cache entry")
+    return CachedResponse(etag, status, headers, bytes(data[offset:]), stored_at)
+
+
+class SharedResponseCache(ResponseCacheBackend):
+    """
+    Response cache shared across worker processes.
+
+    Responses larger than one segment slot are not cached.
+
+    Attributes:
+        segment (SharedKVSegment): Segment holding the encoded responses.
+    """
+
+    def __init__(self, segment: SharedKVSegment | None = None):
+        """
+        Initializes the cache.
+
+        Args:
+            segment (SharedKVSegment | None): Segment to store responses in.
+                Defaults to a new anonymous segment, which must be created
+                before the workers fork.
+        """
+        self.segment = segment if segment is not None else SharedKVSegment()
+
+    def get(self, key: str) -> CachedResponse | None:
+        value = self.segment.get(key)
+        if value is None:
+            return None
+        try:
+            return decode_response(value)
+        except ValueError:
+            # A corrupt entry is a miss; the next render overwrites it.
+            return None
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        self.segment.set(key, encode_response(response))
+
+    def generation(self, prefix: str) -> int:
+        value = self.segment.get(_GENERATION_KEY + prefix)
+        return int.from_bytes(value, "little") if value is not None else 0
+
+    def invalidate(self, prefix: str) -> int:
+        # Not atomic across workers, but two racing invalidations still both
+        # move the generation away from any value read before them.
+        generation = self.generation(prefix) + 1
+        self.segment.set(_GENERATION_KEY + prefix, generation.to_bytes(8, "little"))
+        return self.segment.invalidate(prefix)
@@ -0,0 +1,93 @@
+# Copyright 2025 Mohammadjavad Morady
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module defines the cached response record and the abstract storage backend
+used by the response cache middleware.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """
+    A complete response body together with its validator.
+
+    Attributes:
+        etag (str): Strong entity tag of the body, including the quotes.
+        status (int): HTTP status code.
+        headers (list[tuple[bytes, bytes]]): Raw ASGI response headers.
+        body (bytes): Full response body.
+        stored_at (float): Monotonic time at which the entry was stored.
+    """
+
+    etag: str
+    status: int
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+    stored_at: float
+
+    @property
+    def size(self) -> int:
+        """
+        Approximate memory held by the entry, in bytes.
+        """
+        return len(self.body) + sum(len(k) + len(v) for k, v in self.headers)
+
+
+class ResponseCacheBackend(ABC):
+    """
+    Abstract base class for response cache storage.
+
+    Keys start with the request path, so `invalidate` can drop every entry
+    below a path prefix.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> CachedResponse | None:
+        """
+        Returns the cached response for a key, or None on a miss.
+        """
+        pass
+
+    @abstractmethod
+    def set(self, key: str, response: CachedResponse) -> None:
+        """
+        Stores a response, evicting older entries if the backend is full.
+        """
+        pass
+
+    @abstractmethod
+    def invalidate(self, prefix: str) -> int:
+        """
+        Drops every entry whose key starts with the prefix and advances the
+        generation of the prefix.
+
+        Returns:
+            int: Number of dropped entries.
+        """
+        pass
+
+    @abstractmethod
+    def generation(self, prefix: str) -> int:
+        """
+        Returns a counter that changes every time the prefix is invalidated.
+
+        A response rendered while its prefix was invalidated may hold data
+        from before the write; callers read the generation before rendering
+        and skip `set` when it changed.
+        """
+        pass
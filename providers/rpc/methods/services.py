@@ -0,0 +1,265 @@
+# Copyright 2025 Mohammadjavad Morady
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module implements the gRPC services for node-to-node calls: users CRUD with
+streaming bulk reads, and JWT verification. The services wrap the same session
+factory and `JWTAuth` instance as the FastAPI application, so both transports
+share one set of provider instances and can run in one process.
+"""
+
+import asyncio
+import json
+
+import grpc
+from jwt.exceptions import ExpiredSignatureError, PyJWTError
+from sqlalchemy.exc import IntegrityError
+
+from providers.auth.methods.auth_jwt import JWTAuth
+from providers.response_cache.strategy.cache_strategy import ResponseCacheBackend
+from providers.rpc.protos import providers_pb2, providers_pb2_grpc
+
+DEFAULT_PAGE_SIZE = 500
+
+
+def _to_message(user) -> providers_pb2.User:
+    return providers_pb2.User(id=user.id, name=user.name, email=user.email)
+
+
+class UsersService(providers_pb2_grpc.UsersServicer):
+    """
+    Users CRUD over gRPC.
+
+    Database calls block, so each one runs in a worker thread, like the plain
+    function handlers of the REST application.
+
+    Attributes:
+        session_factory: SQLAlchemy session factory (e.g. `SessionLocal`).
+        user_model: SQLAlchemy model with `id`, `name` and `email` columns.
+        cache (ResponseCacheBackend | None): Response cache of the REST API,
+            invalidated after every committed write so REST clients never get
+            a stale user or a 304 for a deleted one.
+        cache_prefix (str): Path prefix of the cached REST user routes.
+    """
+
+    def __init__(
+        self,
+        session_factory,
+        user_model,
+        cache: ResponseCacheBackend | None = None,
+        cache_prefix: str = "/users",
+    ):
+        self.session_factory = session_factory
+        self.user_model = user_model
+        self.cache = cache
+        self.cache_prefix = cache_prefix
+
+    def _invalidate(self) -> None:
+        # Called on the event loop once the write committed: the in-memory
+        # cache backend is not thread-safe, so worker threads never touch it.
+        if self.cache is not None:
+            self.cache.invalidate(self.cache_prefix)
+
+    def _run(self, work):
+        def in_session():
+            db = self.session_factory()
+            try:
+                return work(db)
+            except Exception:
+                db.rollback()
+                raise
+            finally:
+                db.close()
+
+        return asyncio.to_thread(in_session)
+
+    async def _get_or_abort(self, user_id: int, context):
+        user = await self._run(lambda db: db.get(self.user_model, user_id))
+        if user is None:
+            await context.abort(grpc.StatusCode.NOT_FOUND, "User not found")
+        return user
+
+    async def CreateUser(self, request, context):
+        def create(db):
+            user = self.user_model(name=request.name, email=request.email)
+            db.add(user)
+            db.commit()
+            db.refresh(user)
+            return _to_message(user)
+
+        try:
+            user = await self._run(create)
+        except IntegrityError as e:
+            await context.abort(grpc.StatusCode.ALREADY_EXISTS, str(e.orig))
+        self._invalidate()
+        return user
+
+    async def GetUser(self, request, context):
+        return _to_message(await self._get_or_abort(request.id, context))
+
+    async def UpdateUser(self, request, context):
+        def update(db):
+            user = db.get(self.user_model, request.id)
+            if user is None:
+                return None
+            user.name = request.name
+            user.email = request.email
+            db.commit()
+            db.refresh(user)
+            return _to_message(user)
+
+        try:
+            user = await self._run(update)
+        except IntegrityError as e:
+            await context.abort(grpc.StatusCode.ALREADY_EXISTS, str(e.orig))
+        if user is None:
+            await context.abort(grpc.StatusCode.NOT_FOUND, "User not found")
+        self._invalidate()
+        return user
+
+    async def DeleteUser(self, request, context):
+        def delete(db):
+            user = db.get(self.user_model, request.id)
+            if user is None:
+                return False
+            db.delete(user)
+            db.commit()
+            return True
+
+        if not await self._run(delete):
+            await context.abort(grpc.StatusCode.NOT_FOUND, "User not found")
+        self._invalidate()
+        return providers_pb2.DeleteUserResponse(message="User deleted successfully")
+
+    async def _stream(self, query_factory, page_size: int):
+        # Keyset pagination: one short transaction per page, so a slow client
+        # never holds a connection while the stream is being consumed.
+        model = self.user_model
+        last_id = 0
+        while True:
+            page = await self._run(
+                lambda db: [
+                    _to_message(user)
+                    for user in query_factory(db)
+                    .filter(model.id > last_id)
+                    .order_by(model.id)
+                    .limit(page_size)
+                ]
+            )
+            for user in page:
+                yield user
+            if len(page) < page_size:
+                return
+            last_id = page[-1].id
+
+    async def ListUsers(self, request, context):
+        page_size = request.page_size or DEFAULT_PAGE_SIZE
+        async for user in self._stream(lambda db: db.query(self.user_model), page_size):
+            yield user
+
+    async def SearchUsers(self, request, context):
+        if not request.name and not request.email:
+            await context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                "At least one of name or email must be provided",
+            )
+        model = self.user_model
+
+        def query(db):
+            query = db.query(model)
+            if request.name:
+                query = query.filter(model.name.ilike(f"%{request.name}%"))
+            if request.email:
+                query = query.filter(model.email.ilike(f"%{request.email}%"))
+            return query
+
+        async for user in self._stream(query, DEFAULT_PAGE_SIZE):
+            yield user
+
+    async def GetUsers(self, request_iterator, context):
+        async for request in request_iterator:
+            user = await self._run(lambda db: db.get(self.user_model, request.id))
+            if user is not None:
+                yield _to_message(user)
+
+
+class AuthService(providers_pb2_grpc.AuthServicer):
+    """
+    JWT verification over gRPC, backed by a `JWTAuth` instance.
+
+    Attributes:
+        jwt_auth (JWTAuth): Strategy verifying the tokens.
+    """
+
+    def __init__(self, jwt_auth: JWTAuth):
+        self.jwt_auth = jwt_auth
+
+    def _verify(self, token: str) -> providers_pb2.VerifyTokenResponse:
+        try:
+            payload = self.jwt_auth.decode(token)
+        except ExpiredSignatureError:
+            return providers_pb2.VerifyTokenResponse(error="Token has expired")
+        except PyJWTError:
+            return providers_pb2.VerifyTokenResponse(error="Invalid token")
+        return providers_pb2.VerifyTokenResponse(
+            valid=True, payload_json=json.dumps(payload)
+        )
+
+    async def VerifyToken(self, request, context):
+        return self._verify(request.token)
+
+    async def VerifyTokens(self, request_iterator, context):
+        async for request in request_iterator:
+            yield self._verify(request.token)
+
+
+def build_server(
+    address: str,
+    users: UsersService | None = None,
+    auth: AuthService | None = None,
+) -> grpc.aio.Server:
+    """
+    Builds an asyncio gRPC server with the given services.
+
+    The server is not started; await `server.start()` in the running event
+    loop, e.g. from the FastAPI lifespan, to serve next to the REST API.
+
+    Args:
+        address (str): Address to listen on, e.g. "[::]:50051".
+        users (UsersService | None): Users service to register.
+        auth (AuthService | None): Auth service to register.
+
+    Returns:
+        grpc.aio.Server: The configured server.
+    """
+    server = grpc.aio.server()
+    if users is not None:
+        providers_pb2_grpc.add_UsersServicer_to_server(users, server)
+    if auth is not None:
+        providers_pb2_grpc.add_AuthServicer_to_server(auth, server)
+    server.add_insecure_port(address)
+    return server
+
+
+"""
+Example:
+    >>> import grpc
+    >>> from providers.rpc.protos import providers_pb2, providers_pb2_grpc
+
+    >>> async with grpc.aio.insecure_channel("localhost:50051") as channel:
+    ...     users = providers_pb2_grpc.UsersStub(channel)
+    ...     user = await users.GetUser(providers_pb2.UserId(id=1))
+    ...     async for user in users.ListUsers(providers_pb2.ListUsersRequest()):
+    ...         print(user.name)
+"""
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: providers/rpc/protos/providers.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'providers/rpc/protos/providers.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n$providers/rpc/protos/providers.proto\x12\tproviders\"/\n\x04User\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\r\n\x05\x65mail\x18\x03 \x01(\t\"\x14\n\x06UserId\x12\n\n\x02id\x18\x01 \x01(\x05\")\n\nUserCreate\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t\"5\n\nUserUpdate\x12\n\n\x02id\x18\x01 \x01(\x05\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\r\n\x05\x65mail\x18\x03 \x01(\t\"(\n\tUserQuery\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t\"%\n\x10ListUsersRequest\x12\x11\n\tpage_size\x18\x01 \x01(\r\"%\n\x12\x44\x65leteUserResponse\x12\x0f\n\x07message\x18\x01 \x01(\t\"#\n\x12VerifyTokenRequest\x12\r\n\x05token\x18\x01 \x01(\t\"I\n\x13VerifyTokenResponse\x12\r\n\x05valid\x18\x01 \x01(\x08\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x14\n\x0cpayload_json\x18\x03 \x01(\t2\x8b\x03\n\x05Users\x12\x34\n\nCreateUser\x12\x15.providers.UserCreate\x1a\x0f.providers.User\x12-\n\x07GetUser\x12\x11.providers.UserId\x1a\x0f.providers.User\x12\x34\n\nUpdateUser\x12\x15.providers.UserUpdate\x1a\x0f.providers.User\x12>\n\nDeleteUser\x12\x11.providers.UserId\x1a\x1d.providers.DeleteUserResponse\x12;\n\tListUsers\x12\x1b.providers.ListUsersRequest\x1a\x0f.providers.User0\x01\x12\x36\n\x0bSearchUsers\x12\x14.providers.UserQuery\x1a\x0f.providers.User0\x01\x12\x32\n\x08GetUsers\x12\x11.providers.UserId\x1a\x0f.providers.User(\x01\x30\x01\x32\xa7\x01\n\x04\x41uth\x12L\n\x0bVerifyToken\x12\x1d.providers.VerifyTokenRequest\x1a\x1e.providers.VerifyTokenResponse\x12Q\n\x0cVerifyTokens\x12\x1d.providers.VerifyTokenRequest\x1a\x1e.providers.VerifyTokenResponse(\x01\x30\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'providers.rpc.protos.providers_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_USER']._serialized_start=51
+  _globals['_USER']._serialized_end=98
+  _globals['_USERID']._serialized_start=100
+  _globals['_USERID']._serialized_end=120
+  _globals['_USERCREATE']._serialized_start=122
+  _globals['_USERCREATE']._serialized_end=163
+  _globals['_USERUPDATE']._serialized_start=165
+  _globals['_USERUPDATE']._serialized_end=218
+  _globals['_USERQUERY']._serialized_start=220
+  _globals['_USERQUERY']._serialized_end=260
+  _globals['_LISTUSERSREQUEST']._serialized_start=262
+  _globals['_LISTUSERSREQUEST']._serialized_end=299
+  _globals['_DELETEUSERRESPONSE']._serialized_start=301
+  _globals['_DELETEUSERRESPONSE']._serialized_end=338
+  _globals['_VERIFYTOKENREQUEST']._serialized_start=340
+  _globals['_VERIFYTOKENREQUEST']._serialized_end=375
+  _globals['_VERIFYTOKENRESPONSE']._serialized_start=377
+  _globals['_VERIFYTOKENRESPONSE']._serialized_end=450
+  _globals['_USERS']._serialized_start=453
+  _globals['_USERS']._serialized_end=848
+  _globals['_AUTH']._serialized_start=851
+  _globals['_AUTH']._serialized_end=1018
+# @@protoc_insertion_point(module_scope)
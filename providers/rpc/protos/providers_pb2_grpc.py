@@ -0,0 +1,471 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+import warnings
+
+from providers.rpc.protos import providers_pb2 as providers_dot_rpc_dot_protos_dot_providers__pb2
+
+GRPC_GENERATED_VERSION = '1.84.0'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + ' but the generated code in providers/rpc/protos/providers_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
+
+
+class UsersStub:
+    """Missing associated documentation comment in .proto file."""
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.CreateUser = channel.unary_unary(
+                '/providers.Users/CreateUser',
+                request_serializer=providers_dot_rpc_dot_protos_dot_providers__pb2.UserCreate.SerializeToString,
+                response_deserializer=providers_dot_rpc_dot_protos_dot_providers__pb2.User.FromString,
+                _registered_method=True)
+        self.GetUser = channel.unary_unary(
+                '/providers.Users/GetUser',
+                request_serializer=providers_dot_rpc_dot_protos_dot_providers__pb2.UserId.SerializeToString,
+                response_deserializer=providers_dot_rpc_dot_protos_dot_providers__pb2.User.FromString,
+                _registered_method=True)
+        self.UpdateUser = channel.unary_unary(
+                '/providers.Users/UpdateUser',
+                request_serializer=providers_dot_rpc_dot_protos_dot_providers__pb2.UserUpdate.SerializeToString,
+                response_deserializer=providers_dot_rpc_dot_protos_dot_providers__pb2.User.FromString,
+                _registered_method=True)
+        self.DeleteUser = channel.unary_unary(
+                '/providers.Users/DeleteUser',
+                request_serializer=providers_dot_rpc_dot_protos_dot_providers__pb2.UserId.SerializeToString,
+                response_deserializer=providers_dot_rpc_dot_protos_dot_providers__pb2.DeleteUserResponse.FromString,
+                _registered_method=True)
+        self.ListUsers = channel.unary_stream(
+                '/providers.Users/ListUsers',
+                request_serializer=providers_dot_rpc_dot_protos_dot_providers__pb2.ListUsersRequest.SerializeToString,
+                response_deserializer=providers_dot_rpc_dot_protos_dot_providers__pb2.User.FromString,
+                _registered_method=True)
+        self.SearchUsers = channel.unary_stream(
+                '/providers.Users/SearchUsers',
+                request_serializer=providers_dot_rpc_dot_protos_dot_providers__pb2.UserQuery.SerializeToString,
+                response_deserializer=providers_dot_rpc_dot_protos_dot_providers__pb2.User.FromString,
+                _registered_method=True)
+        self.GetUsers = channel.stream_stream(
+                '/providers.Users/GetUsers',
+                request_serializer=providers_dot_rpc_dot_protos_dot_providers__pb2.UserId.SerializeToString,
+                response_deserializer=providers_dot_rpc_dot_protos_dot_providers__pb2.User.FromString,
+                _registered_method=True)
+
+
+class UsersServicer:
+    """Missing associated documentation comment in .proto file."""
+
+    def CreateUser(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetUser(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def UpdateUser(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def DeleteUser(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ListUsers(self, request, context):
+        """Bulk reads stream rows instead of building one large response.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SearchUsers(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetUsers(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_UsersServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'CreateUser': grpc.unary_unary_rpc_method_handler(
+                    servicer.CreateUser,
+                    request_deserializer=providers_dot_rpc_dot_protos_dot_providers__pb2.UserCreate.FromString,
+                    response_serializer=providers_dot_rpc_dot_protos_dot_providers__pb2.User.SerializeToString,
+            ),
+            'GetUser': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetUser,
+                    request_deserializer=providers_dot_rpc_dot_protos_dot_providers__pb2.UserId.FromString,
+                    response_serializer=providers_dot_rpc_dot_protos_dot_providers__pb2.User.SerializeToString,
+            ),
+            'UpdateUser': grpc.unary_unary_rpc_method_handler(
+                    servicer.UpdateUser,
+                    request_deserializer=providers_dot_rpc_dot_protos_dot_providers__pb2.UserUpdate.FromString,
+                    response_serializer=providers_dot_rpc_dot_protos_dot_providers__pb2.User.SerializeToString,
+            ),
+            'DeleteUser': grpc.unary_unary_rpc_method_handler(
+                    servicer.DeleteUser,
+                    request_deserializer=providers_dot_rpc_dot_protos_dot_providers__pb2.UserId.FromString,
+                    response_serializer=providers_dot_rpc_dot_protos_dot_providers__pb2.DeleteUserResponse.SerializeToString,
+            ),
+            'ListUsers': grpc.unary_stream_rpc_method_handler(
+                    servicer.ListUsers,
+                    request_deserializer=providers_dot_rpc_dot_protos_dot_providers__pb2.ListUsersRequest.FromString,
+                    response_serializer=providers_dot_rpc_dot_protos_dot_providers__pb2.User.SerializeToString,
+            ),
+            'SearchUsers': grpc.unary_stream_rpc_method_handler(
+                    servicer.SearchUsers,
+                    request_deserializer=providers_dot_rpc_dot_protos_dot_providers__pb2.UserQuery.FromString,
+                    response_serializer=providers_dot_rpc_dot_protos_dot_providers__pb2.User.SerializeToString,
+            ),
+            'GetUsers': grpc.stream_stream_rpc_method_handler(
+                    servicer.GetUsers,
+                    request_deserializer=providers_dot_rpc_dot_protos_dot_providers__pb2.UserId.FromString,
+                    response_serializer=providers_dot_rpc_dot_protos_dot_providers__pb2.User.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'providers.Users', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('providers.Users', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class Users:
+    """Missing associated documentation comment in .proto file."""
+
+    @staticmethod
+    def CreateUser(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/providers.Users/CreateUser',
+            providers_dot_rpc_dot_protos_dot_providers__pb2.UserCreate.SerializeToString,
+            providers_dot_rpc_dot_protos_dot_providers__pb2.User.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetUser(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/providers.Users/GetUser',
+            providers_dot_rpc_dot_protos_dot_providers__pb2.UserId.SerializeToString,
+            providers_dot_rpc_dot_protos_dot_providers__pb2.User.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def UpdateUser(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/providers.Users/UpdateUser',
+            providers_dot_rpc_dot_protos_dot_providers__pb2.UserUpdate.SerializeToString,
+            providers_dot_rpc_dot_protos_dot_providers__pb2.User.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def DeleteUser(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/providers.Users/DeleteUser',
+            providers_dot_rpc_dot_protos_dot_providers__pb2.UserId.SerializeToString,
+            providers_dot_rpc_dot_protos_dot_providers__pb2.DeleteUserResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ListUsers(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/providers.Users/ListUsers',
+            providers_dot_rpc_dot_protos_dot_providers__pb2.ListUsersRequest.SerializeToString,
+            providers_dot_rpc_dot_protos_dot_providers__pb2.User.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def SearchUsers(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/providers.Users/SearchUsers',
+            providers_dot_rpc_dot_protos_dot_providers__pb2.UserQuery.SerializeToString,
+            providers_dot_rpc_dot_protos_dot_providers__pb2.User.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetUsers(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/providers.Users/GetUsers',
+            providers_dot_rpc_dot_protos_dot_providers__pb2.UserId.SerializeToString,
+            providers_dot_rpc_dot_protos_dot_providers__pb2.User.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+
+class AuthStub:
+    """Missing associated documentation comment in .proto file."""
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.VerifyToken = channel.unary_unary(
+                '/providers.Auth/VerifyToken',
+                request_serializer=providers_dot_rpc_dot_protos_dot_providers__pb2.VerifyTokenRequest.SerializeToString,
+                response_deserializer=providers_dot_rpc_dot_protos_dot_providers__pb2.VerifyTokenResponse.FromString,
+                _registered_method=True)
+        self.VerifyTokens = channel.stream_stream(
+                '/providers.Auth/VerifyTokens',
+                request_serializer=providers_dot_rpc_dot_protos_dot_providers__pb2.VerifyTokenRequest.SerializeToString,
+                response_deserializer=providers_dot_rpc_dot_protos_dot_providers__pb2.VerifyTokenResponse.FromString,
+                _registered_method=True)
+
+
+class AuthServicer:
+    """Missing associated documentation comment in .proto file."""
+
+    def VerifyToken(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def VerifyTokens(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_AuthServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'VerifyToken': grpc.unary_unary_rpc_method_handler(
+                    servicer.VerifyToken,
+                    request_deserializer=providers_dot_rpc_dot_protos_dot_providers__pb2.VerifyTokenRequest.FromString,
+                    response_serializer=providers_dot_rpc_dot_protos_dot_providers__pb2.VerifyTokenResponse.SerializeToString,
+            ),
+            'VerifyTokens': grpc.stream_stream_rpc_method_handler(
+                    servicer.VerifyTokens,
+                    request_deserializer=providers_dot_rpc_dot_protos_dot_providers__pb2.VerifyTokenRequest.FromString,
+                    response_serializer=providers_dot_rpc_dot_protos_dot_providers__pb2.VerifyTokenResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'providers.Auth', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('providers.Auth', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class Auth:
+    """Missing associated documentation comment in .proto file."""
+
+    @staticmethod
+    def VerifyToken(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/providers.Auth/VerifyToken',
+            providers_dot_rpc_dot_protos_dot_providers__pb2.VerifyTokenRequest.SerializeToString,
+            providers_dot_rpc_dot_protos_dot_providers__pb2.VerifyTokenResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def VerifyTokens(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/providers.Auth/VerifyTokens',
+            providers_dot_rpc_dot_protos_dot_providers__pb2.VerifyTokenRequest.SerializeToString,
+            providers_dot_rpc_dot_protos_dot_providers__pb2.VerifyTokenResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -0,0 +1,260 @@
+# Copyright 2025 Mohammadjavad Morady
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module implements a pre-forking entry point for serving an ASGI app with
+several uvicorn workers. Templates, form models and any other warm-up work run
+once in the parent; the heap is then frozen (`gc.freeze`) so the forked workers
+share those pages copy-on-write instead of each rebuilding them.
+"""
+
+import asyncio
+import gc
+import logging
+import os
+import signal
+import socket
+import time
+from collections import deque
+from typing import Callable, Iterable
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerCrashLoop(RuntimeError):
+    """
+    Raised by `serve` when workers keep dying faster than the restart limit.
+    """
+
+
+def memory_usage_kib() -> dict[str, int]:
+    """
+    Reports the memory usage of the current process.
+
+    Returns:
+        dict[str, int]: "rss" and, on Linux, "pss" and "private" in KiB.
+                        Empty if the platform cannot report it.
+                        Shared copy-on-write pages count fully in rss but are
+                        split between processes in pss.
+    """
+    try:
+        with open("/proc/self/smaps_rollup") as rollup:
+            fields = dict(line.split(":", 1) for line in rollup if ":" in line)
+    except OSError:
+        try:
+            import resource
+        except ImportError:
+            return {}
+        # Peak rather than current RSS, the closest portable figure.
+        return {"rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}
+
+    def kib(*names: str) -> int:
+        return sum(int(fields[name].split()[0]) for name in names)
+
+    return {
+        "rss": kib("Rss"),
+        "pss": kib("Pss"),
+        "private": kib("Private_Clean", "Private_Dirty"),
+    }
+
+
+def _bind(host: str, port: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _run_worker(
+    index: int,
+    app,
+    sock: socket.socket,
+    after_fork: Iterable[Callable[[], None]],
+    log_level: str,
+) -> None:
+    import uvicorn
+
+    forked_at = time.perf_counter()
+    for hook in after_fork:
+        hook()
+    server = uvicorn.Server(uvicorn.Config(app, log_level=log_level))
+
+    async def serve():
+        task = asyncio.create_task(server.serve(sockets=[sock]))
+        while not server.started and not task.done():
+            await asyncio.sleep(0.005)
+        if server.started:
+            logger.info(
+                "worker %d (pid %d) ready: warm-up=%.1fms memory=%s",
+                index,
+                os.getpid(),
+                (time.perf_counter() - forked_at) * 1e3,
+                memory_usage_kib(),
+            )
+        await task
+
+    asyncio.run(serve())
+
+
+def serve(
+    app,
+    host: str = "0.0.0.0",
+    port: int = 8000,
+    workers: int | None = None,
+    preload: Iterable[Callable[[], None]] = (),
+    after_fork: Iterable[Callable[[], None]] = (),
+    log_level: str = "info",
+    max_restarts: int = 5,
+    restart_window: float = 60.0,
+    restart_backoff: float = 0.5,
+) -> None:
+    """
+    Serves an ASGI app with N pre-forked uvicorn workers sharing one socket.
+
+    Workers that die are restarted after an exponential backoff. When more
+    than `max_restarts` workers die within `restart_window` seconds, e.g.
+    because of a bad import or an unreachable database, every worker is
+    stopped and `WorkerCrashLoop` is raised. SIGINT and SIGTERM are forwarded to the
+    workers, which shut down gracefully. Without `os.fork` (Windows) or with a
+    single worker the app is served in-process.
+
+    Args:
+        app: The ASGI application.
+        host (str): Interface to bind.
+        port (int): Port to bind.
+        workers (int | None): Number of workers. Defaults to the CPU count.
+        preload (Iterable[Callable]): Hooks run once in the parent before the
+            fork, e.g. compiling templates or building form models.
+        after_fork (Iterable[Callable]): Hooks run in every worker right after
+            the fork, e.g. disposing inherited database connection pools.
+        log_level (str): Uvicorn log level.
+        max_restarts (int): Restarts allowed within `restart_window`.
+        restart_window (float): Seconds over which restarts are counted.
+        restart_backoff (float): Delay before the first restart, in seconds;
+            doubled for each further restart within the window, up to 30s.
+
+    Raises:
+        WorkerCrashLoop: If workers crash more often than allowed.
+    """
+    preload, after_fork = list(preload), list(after_fork)
+    workers = workers or os.cpu_count() or 1
+
+    started = time.perf_counter()
+    for hook in preload:
+        hook()
+    logger.info(
+        "preloaded %d hooks in %.1fms: memory=%s",
+        len(preload),
+        (time.perf_counter() - started) * 1e3,
+        memory_usage_kib(),
+    )
+
+    sock = _bind(host, port)
+    if workers == 1 or not hasattr(os, "fork"):
+        _run_worker(0, app, sock, after_fork, log_level)
+        return
+
+    # Everything allocated so far is moved to the permanent generation, so the
+    # collector never touches (and un-shares) those pages in the workers.
+    gc.collect()
+    gc.freeze()
+
+    children: dict[int, int] = {}
+    stopping = False
+    crashed = False
+    restarts: deque[float] = deque()
+
+    def spawn(index: int) -> None:
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            code = 0
+            try:
+                _run_worker(index, app, sock, after_fork, log_level)
+            except BaseException:
+                logger.exception("worker %d crashed", index)
+                code = 1
+            finally:
+                os._exit(code)
+        children[pid] = index
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in children:
+            os.kill(pid, signal.SIGTERM)
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+
+    for index in range(workers):
+        spawn(index)
+    logger.info("serving on %s:%d with %d workers", host, port, workers)
+
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        except InterruptedError:
+            continue
+        index = children.pop(pid)
+        if stopping:
+            continue
+        code = os.waitstatus_to_exitcode(status)
+        now = time.monotonic()
+        while restarts and now - restarts[0] > restart_window:
+            restarts.popleft()
+        if len(restarts) >= max_restarts:
+            logger.error(
+                "worker %d (pid %d) exited with %d; %d restarts in %.0fs, giving up",
+                index,
+                pid,
+                code,
+                len(restarts),
+                restart_window,
+            )
+            crashed = True
+            stop(None, None)
+            continue
+        restarts.append(now)
+        delay = min(30.0, restart_backoff * 2 ** (len(restarts) - 1))
+        logger.warning(
+            "worker %d (pid %d) exited with %d, restarting in %.1fs",
+            index,
+            pid,
+            code,
+            delay,
+        )
+        time.sleep(delay)
+        if not stopping:
+            spawn(index)
+    sock.close()
+    if crashed:
+        raise WorkerCrashLoop(
+            f"workers crashed more than {max_restarts} times in {restart_window}s"
+        )
+
+
+"""
+Example:
+    >>> from providers.template_loader.methods.jinja_loader import JinjaTemplateLoader
+
+    >>> loader = JinjaTemplateLoader("templates")
+    >>> serve(app, port=8000, workers=4, preload=[loader.preload])
+"""
@@ -0,0 +1,251 @@
+# Copyright 2025 Mohammadjavad Morady
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module implements a fixed-size key-value segment backed by a shared mmap.
+A segment created before the workers fork is mapped by all of them, so caches
+built on top of it are warmed once and shared instead of duplicated per worker.
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: no fork, so the in-process lock is enough
+    fcntl = None
+
+_MAGIC = b"PKV1"
+_HEADER = struct.Struct("<4sII")  # magic, slots, slot_size
+_SLOT = struct.Struct("<BxHIdQ")  # state, key_len, value_len, expires_at, hash
+_HEADER_SIZE = 64
+
+_EMPTY = 0
+_USED = 1
+_DELETED = 2
+
+
+def _default_dir() -> str | None:
+    return "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+class SharedKVSegment:
+    """
+    Open-addressing hash table of fixed-size slots in a shared memory mapping.
+
+    Writers take an exclusive `lockf` lock on the backing file and readers a
+    shared one, so the segment is safe to use from several processes. When all
+    probed slots are taken, the slot closest to expiry is overwritten.
+
+    Attributes:
+        slots (int): Number of slots in the table.
+        slot_size (int): Size of one slot, including its header, in bytes.
+        path (str | None): Path of the backing file, or None if it was unlinked.
+    """
+
+    def __init__(
+        self,
+        path: str | None = None,
+        slots: int = 4096,
+        slot_size: int = 4096,
+        max_probe: int = 8,
+    ):
+        """
+        Creates a segment, or attaches to an existing one at `path`.
+
+        Args:
+            path (str | None): Backing file. When omitted, an anonymous file is
+                               created and unlinked immediately, so the segment
+                               is only reachable by processes forked from here.
+            slots (int): Number of slots. Ignored when attaching.
+            slot_size (int): Bytes per slot. Ignored when attaching.
+            max_probe (int): Slots probed per lookup.
+        """
+        self.max_probe = max_probe
+        self._lock = threading.Lock()
+
+        if path is None:
+            fd, temp_path = tempfile.mkstemp(prefix="providers-kv-", dir=_default_dir())
+            os.unlink(temp_path)
+            self.path = None
+        else:
+            fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+            self.path = path
+        self._fd = fd
+
+        with self._file_lock(exclusive=True):
+            if os.fstat(fd).st_size >= _HEADER_SIZE:
+                header = os.pread(fd, _HEADER.size, 0)
+                magic, slots, slot_size = _HEADER.unpack(header)
+                if magic != _MAGIC:
+                    raise ValueError(f"{path} is not a shared KV segment")
+            else:
+                os.ftruncate(fd, _HEADER_SIZE + slots * slot_size)
+                os.pwrite(fd, _HEADER.pack(_MAGIC, slots, slot_size), 0)
+        self.slots = slots
+        self.slot_size = slot_size
+        self._map = mmap.mmap(fd, _HEADER_SIZE + slots * slot_size)
+
+    @contextmanager
+    def _file_lock(self, exclusive: bool):
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            fcntl.lockf(self._fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _encode(key: str | bytes) -> tuple[bytes, int]:
+        raw = key.encode() if isinstance(key, str) else key
+        digest = hashlib.blake2b(raw, digest_size=8).digest()
+        return raw, int.from_bytes(digest, "little")
+
+    def _offset(self, index: int) -> int:
+        return _HEADER_SIZE + (index % self.slots) * self.slot_size
+
+    def _find(self, raw: bytes, key_hash: int) -> int | None:
+        for probe in range(self.max_probe):
+            offset = self._offset(key_hash + probe)
+            state, key_len, _, _, slot_hash = _SLOT.unpack_from(self._map, offset)
+            if state == _EMPTY:
+                return None
+            if state == _USED and slot_hash == key_hash:
+                start = offset + _SLOT.size
+                if self._map[start : start + key_len] == raw:
+                    return offset
+        return None
+
+    def get(self, key: str | bytes) -> bytes | None:
+        """
+        Returns the value stored under a key, or None if missing or expired.
+        """
+        raw, key_hash = self._encode(key)
+        with self._file_lock(exclusive=False):
+            offset = self._find(raw, key_hash)
+            if offset is None:
+                return None
+            _, key_len, value_len, expires_at, _ = _SLOT.unpack_from(self._map, offset)
+            if expires_at and expires_at < time.time():
+                return None
+            start = offset + _SLOT.size + key_len
+            return self._map[start : start + value_len]
+
+    def set(self, key: str | bytes, value: bytes, ttl: float | None = None) -> bool:
+        """
+        Stores a value, replacing any previous value of the key.
+
+        Args:
+            key (str | bytes): The key.
+            value (bytes): The value.
+            ttl (float | None): Seconds until the value expires. None keeps it
+                                until it is evicted or deleted.
+
+        Returns:
+            bool: False if key and value do not fit in one slot.
+        """
+        raw, key_hash = self._encode(key)
+        if _SLOT.size + len(raw) + len(value) > self.slot_size:
+            return False
+        expires_at = time.time() + ttl if ttl else 0.0
+
+        with self._file_lock(exclusive=True):
+            offset = self._find(raw, key_hash)
+            if offset is None:
+                offset = self._free_slot(key_hash)
+            _SLOT.pack_into(
+                self._map, offset, _USED, len(raw), len(value), expires_at, key_hash
+            )
+            start = offset + _SLOT.size
+            self._map[start : start + len(raw)] = raw
+            self._map[start + len(raw) : start + len(raw) + len(value)] = value
+        return True
+
+    def _free_slot(self, key_hash: int) -> int:
+        now = time.time()
+        victim, victim_expiry = None, None
+        for probe in range(self.max_probe):
+            offset = self._offset(key_hash + probe)
+            state, _, _, expires_at, _ = _SLOT.unpack_from(self._map, offset)
+            if state != _USED or (expires_at and expires_at < now):
+                return offset
+            # Entries without expiry are evicted last.
+            expiry = expires_at or float("inf")
+            if victim is None or expiry < victim_expiry:
+                victim, victim_expiry = offset, expiry
+        return victim
+
+    def delete(self, key: str | bytes) -> bool:
+        """
+        Removes a key.
+
+        Returns:
+            bool: True if the key was present.
+        """
+        raw, key_hash = self._encode(key)
+        with self._file_lock(exclusive=True):
+            offset = self._find(raw, key_hash)
+            if offset is None:
+                return False
+            self._map[offset] = _DELETED
+        return True
+
+    def invalidate(self, prefix: str | bytes) -> int:
+        """
+        Removes every key starting with the prefix. Scans the whole table.
+
+        Returns:
+            int: Number of removed keys.
+        """
+        raw_prefix = prefix.encode() if isinstance(prefix, str) else prefix
+        removed = 0
+        with self._file_lock(exclusive=True):
+            for index in range(self.slots):
+                offset = self._offset(index)
+                state, key_len, _, _, _ = _SLOT.unpack_from(self._map, offset)
+                if state != _USED or key_len < len(raw_prefix):
+                    continue
+                start = offset + _SLOT.size
+                if self._map[start : start + len(raw_prefix)] == raw_prefix:
+                    self._map[offset] = _DELETED
+                    removed += 1
+        return removed
+
+    def close(self) -> None:
+        """
+        Unmaps the segment and closes the backing file.
+        """
+        self._map.close()
+        os.close(self._fd)
+
+
+"""
+Example:
+    Create the segment before forking, then use it from every worker:
+
+    >>> segment = SharedKVSegment(slots=1024, slot_size=2048)
+    >>> segment.set("jwt:abc", b'{"sub": "user"}', ttl=60)
+    True
+    >>> segment.get("jwt:abc")
+    b'{"sub": "user"}'
+"""
@@ -19,7 +19,6 @@ using the Jinja2 templating engine.
 from typing import Dict
 
 from fastapi.responses import HTMLResponse
-from jinja2 import Environment, FileSystemLoader, select_autoescape
 
 from providers.template_loader.strategy.jinja_strategy import AbstractTemplateLoader
 
@@ -37,12 +36,30 @@ class JinjaTemplateLoader(AbstractTemplateLoader):
             templates_dir: The path to the directory where Jinja2 templates are stored.
                            Defaults to "templates".
         """
+        # Jinja2 is only imported once a loader is actually created.
+        from jinja2 import Environment, FileSystemLoader, select_autoescape
+
         self.templates_dir = templates_dir
         self.env = Environment(
             loader=FileSystemLoader(self.templates_dir),
             autoescape=select_autoescape(["html", "xml"]),
         )
 
+    def preload(self) -> int:
+        """
+        Compiles every template in the directory into the environment cache.
+
+        Intended to run before forking workers, so they share the compiled
+        templates instead of each compiling them on first render.
+
+        Returns:
+            int: Number of compiled templates.
+        """
+        names = self.env.list_templates()
+        for name in names:
+            self.env.get_template(name)
+        return len(names)
+
     def render(self, template_name: str, context: Dict) -> HTMLResponse:
         """
         Loads and renders a Jinja2 template.
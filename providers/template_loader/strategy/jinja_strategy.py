@@ -17,21 +17,27 @@ This module defines an abstract base class for template loaders
 and provides an example of how such a loader might be used within a FastAPI application.
 """
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import TYPE_CHECKING, Dict
 
-from fastapi.responses import HTMLResponse
+from providers.instrumentation.methods.recorder import InstrumentedStrategy
 
+if TYPE_CHECKING:
+    from fastapi.responses import HTMLResponse
 
-class AbstractTemplateLoader(ABC):
+
+class AbstractTemplateLoader(InstrumentedStrategy, ABC):
     """
     An abstract base class defining the interface for template loaders.
 
     Subclasses must implement the `render` method to load and render
-    templates using a specific templating engine.
+    templates using a specific templating engine. Calls are timed as the
+    "template.render" stage.
     """
 
+    __instrumented_methods__ = {"render": "template.render"}
+
     @abstractmethod
-    def render(self, template_name: str, context: Dict) -> HTMLResponse:
+    def render(self, template_name: str, context: Dict) -> "HTMLResponse":
         """
         Renders a template given its name and a context dictionary.
 
@@ -0,0 +1,171 @@
+# Copyright 2025 Mohammadjavad Morady
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module implements a circuit breaker for upstream calls. After repeated
+failures the circuit opens and calls fail fast instead of queueing behind a
+dead node; after a cool-down a few trial calls decide whether it closes again.
+"""
+
+import logging
+import math
+import time
+from typing import Callable
+
+from providers.instrumentation.methods.events import EVENTS
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """
+    Raised instead of calling an upstream whose circuit is open.
+
+    Attributes:
+        retry_after (int): Seconds until trial calls are allowed again.
+    """
+
+    def __init__(self, name: str, retry_after: int):
+        super().__init__(f"Circuit for {name} is open, retry in {retry_after}s")
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open circuit breaker.
+
+    Attributes:
+        name (str): Name used in errors and events, usually the upstream URL.
+        failure_threshold (int): Consecutive failures that open the circuit.
+        reset_timeout (float): Seconds the circuit stays open.
+        half_open_max_calls (int): Trial calls allowed while half-open.
+        state (str): One of "closed", "open" or "half_open".
+        generation (int): Number of state transitions so far. Outcomes of
+            calls admitted under an older generation are ignored, so a slow
+            call started before the circuit opened cannot close it again.
+    """
+
+    def __init__(
+        self,
+        name: str = "upstream",
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.state = CLOSED
+        self.generation = 0
+        self._clock = clock
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_calls = 0
+
+    def _transition(self, state: str) -> None:
+        if state == self.state:
+            return
+        EVENTS.emit(
+            "transport.circuit_state",
+            logging.WARNING if state == OPEN else logging.INFO,
+            upstream=self.name,
+            previous=self.state,
+            state=state,
+        )
+        self.state = state
+        self.generation += 1
+
+    def before_call(self) -> int:
+        """
+        Checks that a call may go through.
+
+        Returns:
+            int: The generation the call is admitted under, to pass back with
+                 its outcome.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with all
+                              trial calls already in flight.
+        """
+        if self.state == OPEN:
+            remaining = self._opened_at + self.reset_timeout - self._clock()
+            if remaining > 0:
+                raise CircuitOpenError(self.name, math.ceil(remaining))
+            self._transition(HALF_OPEN)
+            self._trial_calls = 0
+        if self.state == HALF_OPEN:
+            if self._trial_calls >= self.half_open_max_calls:
+                raise CircuitOpenError(self.name, 1)
+            self._trial_calls += 1
+        return self.generation
+
+    def _is_stale(self, generation: int | None) -> bool:
+        return generation is not None and generation != self.generation
+
+    def record_success(self, generation: int | None = None) -> None:
+        """
+        Records a successful call; a successful trial call closes the circuit.
+
+        Args:
+            generation (int | None): Generation returned by `before_call`.
+                                     Defaults to the current one.
+        """
+        if self._is_stale(generation) or self.state == OPEN:
+            return
+        self._failures = 0
+        if self.state == HALF_OPEN:
+            self._transition(CLOSED)
+
+    def record_cancelled(self, generation: int | None = None) -> None:
+        """
+        Gives back the trial slot of a call that ended without an outcome.
+
+        Args:
+            generation (int | None): Generation returned by `before_call`.
+                                     Defaults to the current one.
+        """
+        if self._is_stale(generation):
+            return
+        if self.state == HALF_OPEN and self._trial_calls:
+            self._trial_calls -= 1
+
+    def record_failure(self, generation: int | None = None) -> None:
+        """
+        Records a failed call; enough of them, or a failed trial call, open
+        the circuit.
+
+        Args:
+            generation (int | None): Generation returned by `before_call`.
+                                     Defaults to the current one.
+        """
+        if self._is_stale(generation) or self.state == OPEN:
+            return
+        self._failures += 1
+        if self.state == HALF_OPEN or self._failures >= self.failure_threshold:
+            self._opened_at = self._clock()
+            self._transition(OPEN)
+
+
+"""
+Example:
+    >>> breaker = CircuitBreaker("http://node-2:8000", failure_threshold=3)
+    >>> breaker.before_call()
+    >>> breaker.record_failure()
+    >>> breaker.state
+    'closed'
+"""
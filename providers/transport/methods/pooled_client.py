@@ -0,0 +1,271 @@
+# Copyright 2025 Mohammadjavad Morady
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module implements the HTTP client used between nodes. Connections to each
+upstream are pooled in one shared `httpx.AsyncClient` (HTTP/2 when `h2` is
+installed), identical in-flight GETs are coalesced into a single upstream call,
+slow idempotent calls are hedged, and a circuit breaker fails fast on dead nodes.
+"""
+
+import asyncio
+import importlib.util
+import os
+
+import httpx
+
+from providers.instrumentation.methods.recorder import RECORDER
+from providers.transport.methods.circuit_breaker import CircuitBreaker
+from providers.transport.strategy.transport_strategy import UpstreamClient
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+COALESCED_METHODS = frozenset({"GET", "HEAD"})
+
+
+def http2_available() -> bool:
+    """
+    Returns whether the optional `h2` package needed for HTTP/2 is installed.
+    """
+    return importlib.util.find_spec("h2") is not None
+
+
+class ClientPool:
+    """
+    One keep-alive `httpx.AsyncClient` per upstream, shared by all callers.
+
+    Clients are created lazily on first use, so a pool built before the
+    workers fork never shares sockets between processes; a forked process
+    starts with an empty pool.
+
+    Attributes:
+        limits (httpx.Limits): Connection and keep-alive limits per upstream.
+        timeout (httpx.Timeout): Default timeout of every request.
+        http2 (bool): Whether clients negotiate HTTP/2.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        timeout: float = 10.0,
+        http2: bool | None = None,
+    ):
+        """
+        Initializes the pool.
+
+        Args:
+            max_connections (int): Open connections allowed per upstream.
+            max_keepalive_connections (int): Idle connections kept per upstream.
+            keepalive_expiry (float): Seconds an idle connection is kept.
+            timeout (float): Default request timeout, in seconds.
+            http2 (bool | None): Force HTTP/2 on or off. Defaults to on when
+                                 `h2` is installed.
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.timeout = httpx.Timeout(timeout)
+        self.http2 = http2_available() if http2 is None else http2
+        self._clients: dict[str, httpx.AsyncClient] = {}
+        self._pid = os.getpid()
+
+    def client(
+        self, base_url: str, transport: httpx.AsyncBaseTransport | None = None
+    ) -> httpx.AsyncClient:
+        """
+        Returns the shared client of an upstream, creating it if needed.
+
+        Args:
+            base_url (str): Base URL of the upstream.
+            transport (httpx.AsyncBaseTransport | None): Custom transport, e.g.
+                `httpx.ASGITransport` for an in-process upstream.
+
+        Returns:
+            httpx.AsyncClient: The pooled client.
+        """
+        if os.getpid() != self._pid:
+            # Inherited clients hold the parent's sockets; never reuse them.
+            self._clients = {}
+            self._pid = os.getpid()
+        client = self._clients.get(base_url)
+        if client is None or client.is_closed:
+            client = self._clients[base_url] = httpx.AsyncClient(
+                base_url=base_url,
+                http2=self.http2,
+                limits=self.limits,
+                timeout=self.timeout,
+                transport=transport,
+            )
+        return client
+
+    async def aclose(self, base_url: str | None = None) -> None:
+        """
+        Closes the client of one upstream, or of all upstreams.
+        """
+        if base_url is not None:
+            clients = [self._clients.pop(base_url)] if base_url in self._clients else []
+        else:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            await client.aclose()
+
+
+POOL = ClientPool()
+
+
+class PooledUpstreamClient(UpstreamClient):
+    """
+    Client of one upstream built on a shared `ClientPool`.
+
+    Responses of coalesced requests are shared between all callers and must
+    be treated as read-only.
+
+    Attributes:
+        pool (ClientPool): Pool holding the connections.
+        breaker (CircuitBreaker): Breaker guarding the upstream.
+        hedge_after (float | None): Seconds after which a slow idempotent
+                                    request is sent again. None disables hedging.
+        max_attempts (int): Attempts per hedged request, including the first.
+        coalesce (bool): Whether identical in-flight GETs share one call.
+        coalesced (int): Requests answered by another caller's call.
+        hedged (int): Hedge requests sent.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        pool: ClientPool | None = None,
+        breaker: CircuitBreaker | None = None,
+        hedge_after: float | None = None,
+        max_attempts: int = 2,
+        coalesce: bool = True,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        super().__init__(base_url)
+        self.pool = pool if pool is not None else POOL
+        self.breaker = breaker if breaker is not None else CircuitBreaker(base_url)
+        self.hedge_after = hedge_after
+        self.max_attempts = max_attempts
+        self.coalesce = coalesce
+        self.transport = transport
+        self.coalesced = 0
+        self.hedged = 0
+        self._in_flight: dict[tuple, asyncio.Future] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self.pool.client(self.base_url, self.transport)
+
+    def _coalesce_key(self, method: str, path: str, kwargs: dict) -> tuple | None:
+        if not self.coalesce or method not in COALESCED_METHODS:
+            return None
+        if kwargs.keys() - {"params", "headers"}:
+            return None
+        # Headers are part of the key, so callers with different credentials
+        # never receive each other's responses.
+        params = str(httpx.QueryParams(kwargs.get("params")))
+        headers = tuple(sorted(httpx.Headers(kwargs.get("headers")).multi_items()))
+        return method, path, params, headers
+
+    async def request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        method = method.upper()
+        key = self._coalesce_key(method, path, kwargs)
+        if key is None:
+            return await self._call(method, path, kwargs)
+
+        call = self._in_flight.get(key)
+        if call is None:
+            call = asyncio.ensure_future(self._call(method, path, kwargs))
+            self._in_flight[key] = call
+            call.add_done_callback(lambda _: self._forget(key, call))
+        else:
+            self.coalesced += 1
+        # Shielded, so a caller going away does not cancel the shared call.
+        return await asyncio.shield(call)
+
+    def _forget(self, key: tuple, call: asyncio.Future) -> None:
+        if self._in_flight.get(key) is call:
+            del self._in_flight[key]
+        if not call.cancelled():
+            # Mark the error as retrieved when every caller has gone away.
+            call.exception()
+
+    async def _call(self, method: str, path: str, kwargs: dict) -> httpx.Response:
+        generation = self.breaker.before_call()
+        try:
+            if self.hedge_after is not None and method in IDEMPOTENT_METHODS:
+                response = await self._hedged(method, path, kwargs)
+            else:
+                response = await self._attempt(method, path, kwargs)
+        except httpx.TransportError:
+            self.breaker.record_failure(generation)
+            raise
+        except BaseException:
+            self.breaker.record_cancelled(generation)
+            raise
+        if response.status_code >= 500:
+            self.breaker.record_failure(generation)
+        else:
+            self.breaker.record_success(generation)
+        return response
+
+    async def _attempt(self, method: str, path: str, kwargs: dict) -> httpx.Response:
+        with RECORDER.stage("transport.attempt", type(self).__name__):
+            return await self.client.request(method, path, **kwargs)
+
+    async def _hedged(self, method: str, path: str, kwargs: dict) -> httpx.Response:
+        attempts = 1
+        pending = {asyncio.ensure_future(self._attempt(method, path, kwargs))}
+        error = None
+        try:
+            while pending:
+                can_hedge = attempts < self.max_attempts
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=self.hedge_after if can_hedge else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for attempt in done:
+                    if attempt.exception() is None:
+                        return attempt.result()
+                    error = attempt.exception()
+                # Hedge when the timer fired, retry at once when all attempts
+                # failed; either way the first response to arrive wins.
+                if can_hedge and (not done or not pending):
+                    if not done:
+                        self.hedged += 1
+                    attempts += 1
+                    pending.add(
+                        asyncio.ensure_future(self._attempt(method, path, kwargs))
+                    )
+            raise error
+        finally:
+            for attempt in pending:
+                attempt.cancel()
+
+    async def aclose(self) -> None:
+        await self.pool.aclose(self.base_url)
+
+
+"""
+Example:
+    >>> node = PooledUpstreamClient("http://node-2:8000", hedge_after=0.05)
+    >>> response = await node.get("/users/1", headers={"Authorization": token})
+    >>> response.json()
+    {'id': 1, 'name': 'John', 'email': 'john@example.com'}
+"""
@@ -0,0 +1,66 @@
+# Copyright 2025 Mohammadjavad Morady
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module defines the abstract client used to call library services on other
+nodes. Implementations decide how connections are pooled and how slow or
+failing upstreams are handled; callers only see `request` and `get`.
+"""
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+from providers.instrumentation.methods.recorder import InstrumentedStrategy
+
+if TYPE_CHECKING:
+    import httpx
+
+
+class UpstreamClient(InstrumentedStrategy, ABC):
+    """
+    Abstract base class for clients of one upstream service.
+
+    Attributes:
+        base_url (str): Base URL of the upstream, e.g. "http://node-2:8000".
+    """
+
+    __instrumented_methods__ = {"request": "transport.request"}
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+
+    @abstractmethod
+    async def request(self, method: str, path: str, **kwargs) -> "httpx.Response":
+        """
+        Sends a request to the upstream.
+
+        Args:
+            method (str): HTTP method.
+            path (str): Path relative to `base_url`.
+            **kwargs: Passed on to `httpx.AsyncClient.request`.
+
+        Returns:
+            httpx.Response: The upstream response, with its body read.
+        """
+        pass
+
+    async def get(self, path: str, **kwargs) -> "httpx.Response":
+        return await self.request("GET", path, **kwargs)
+
+    @abstractmethod
+    async def aclose(self) -> None:
+        """
+        Releases the connections held for this upstream.
+        """
+        pass
@@ -0,0 +1,196 @@
+import asyncio
+import time
+
+import jwt
+import pytest
+from fastapi import Depends, FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+
+from providers.admission.methods.admission_middleware import (
+    AdmissionControlMiddleware,
+    PriorityClasses,
+    Rejected,
+    RouteLimiter,
+)
+from providers.admission.methods.limits import AIMDLimit, FixedLimit, GradientLimit
+from providers.auth.methods.auth_jwt import JWTAuth
+
+SECRET_KEY = "test-secret-key"
+
+
+def bearer(tier: str) -> dict:
+    payload = {"sub": tier, "tier": tier, "exp": int(time.time()) + 600}
+    return {"Authorization": f"Bearer {jwt.encode(payload, SECRET_KEY, 'HS256')}"}
+
+
+@pytest.fixture
+def test_app():
+    app = FastAPI()
+    app.state.gate = asyncio.Event()
+    app.state.seen = []
+    jwt_auth = JWTAuth(SECRET_KEY)
+
+    @app.get("/slow/{item}", dependencies=[Depends(jwt_auth.authenticate)])
+    async def slow(item: str, request: Request):
+        await app.state.gate.wait()
+        app.state.seen.append(getattr(request.state, "user_payload", {}).get("tier"))
+        return {"item": item}
+
+    app.add_middleware(
+        AdmissionControlMiddleware,
+        routes={"/slow/{item}": RouteLimiter(FixedLimit(1), max_queue=1)},
+        jwt_auth=jwt_auth,
+        classify=PriorityClasses(classes={"premium": 0, "free": 1}),
+    )
+    return app
+
+
+async def wait_until(condition):
+    for _ in range(100):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not reached")
+
+
+@pytest.mark.asyncio
+async def test_sheds_with_503_when_queue_is_full(test_app):
+    limiter = test_app.user_middleware[0].kwargs["routes"]["/slow/{item}"]
+    transport = ASGITransport(app=test_app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        running = asyncio.create_task(client.get("/slow/1"))
+        await wait_until(lambda: limiter.in_flight == 1)
+        queued = asyncio.create_task(client.get("/slow/2"))
+        await wait_until(lambda: limiter.queued == 1)
+
+        shed = await client.get("/slow/3")
+        test_app.state.gate.set()
+        responses = await asyncio.gather(running, queued)
+
+    assert shed.status_code == 503
+    assert int(shed.headers["retry-after"]) >= 1
+    assert [r.status_code for r in responses] == [200, 200]
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_higher_priority_class_evicts_queued_request(test_app):
+    limiter = test_app.user_middleware[0].kwargs["routes"]["/slow/{item}"]
+    transport = ASGITransport(app=test_app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        running = asyncio.create_task(client.get("/slow/1", headers=bearer("free")))
+        await wait_until(lambda: limiter.in_flight == 1)
+        free = asyncio.create_task(client.get("/slow/2", headers=bearer("free")))
+        await wait_until(lambda: limiter.queued == 1)
+        premium = asyncio.create_task(client.get("/slow/3", headers=bearer("premium")))
+
+        evicted = await free
+        test_app.state.gate.set()
+        await asyncio.gather(running, premium)
+
+    assert evicted.status_code == 429
+    assert "retry-after" in evicted.headers
+    assert premium.result().status_code == 200
+    assert test_app.state.seen == ["free", "premium"]
+
+
+@pytest.mark.asyncio
+async def test_token_is_verified_once_and_only_when_queueing(test_app, monkeypatch):
+    jwt_auth = test_app.user_middleware[0].kwargs["jwt_auth"]
+    limiter = test_app.user_middleware[0].kwargs["routes"]["/slow/{item}"]
+    decoded = []
+    decode = jwt_auth.decode
+    monkeypatch.setattr(
+        jwt_auth, "decode", lambda token: decoded.append(1) or decode(token)
+    )
+
+    transport = ASGITransport(app=test_app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        running = asyncio.create_task(client.get("/slow/1", headers=bearer("free")))
+        await wait_until(lambda: limiter.in_flight == 1)
+        queued = asyncio.create_task(client.get("/slow/2", headers=bearer("free")))
+        await wait_until(lambda: limiter.queued == 1)
+        test_app.state.gate.set()
+        responses = await asyncio.gather(running, queued)
+
+    assert [r.status_code for r in responses] == [200, 200]
+    # The admitted request is decoded by its route only; the queued one by the
+    # middleware, whose payload the route then reuses.
+    assert len(decoded) == 2
+    assert test_app.state.seen == ["free", "free"]
+
+
+@pytest.mark.asyncio
+async def test_method_specific_routes_do_not_share_limiters():
+    app = FastAPI()
+    gate = asyncio.Event()
+
+    @app.get("/items/")
+    async def scan():
+        await gate.wait()
+        return []
+
+    @app.post("/items/")
+    async def create():
+        return {"created": True}
+
+    limiter = RouteLimiter(FixedLimit(1), max_queue=0)
+    app.add_middleware(AdmissionControlMiddleware, routes={("GET", "/items/"): limiter})
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        running = asyncio.create_task(client.get("/items/"))
+        await wait_until(lambda: limiter.in_flight == 1)
+        created = await client.post("/items/")
+        shed = await client.get("/items/")
+        gate.set()
+        await running
+
+    assert created.status_code == 200
+    assert shed.status_code == 503
+
+
+@pytest.mark.asyncio
+async def test_release_at_queue_timeout_admits_the_waiter():
+    limiter = RouteLimiter(FixedLimit(1), max_queue=1, queue_timeout=0.05)
+    in_flight = await limiter.acquire(0)
+    # Scheduled before the waiter's timeout, so the slot is granted in the same
+    # loop tick as the timeout fires.
+    asyncio.get_running_loop().call_later(
+        limiter.queue_timeout, limiter.release, 0.05, in_flight, False
+    )
+
+    try:
+        waited = await limiter.acquire(0)
+    except Rejected:
+        assert limiter.in_flight == 0
+    else:
+        assert limiter.in_flight == 1
+        limiter.release(0.0, waited, False)
+
+    assert limiter.queued == 0
+    assert limiter.in_flight == 0
+    assert await limiter.acquire(0) == 0
+
+
+def test_aimd_limit_adapts_to_latency():
+    limit = AIMDLimit(initial=10, max_limit=20, target_latency=0.1)
+
+    limit.update(0.01, in_flight=10, dropped=False)
+    assert limit.limit == 11
+    limit.update(0.5, in_flight=10, dropped=False)
+    assert limit.limit == 9
+    limit.update(0.01, in_flight=0, dropped=False)
+    assert limit.limit == 9
+
+
+def test_gradient_limit_shrinks_when_latency_grows():
+    limit = GradientLimit(initial=50, max_limit=100)
+    for _ in range(10):
+        limit.update(0.01, in_flight=50, dropped=False)
+    grown = limit.limit
+    for _ in range(20):
+        limit.update(0.5, in_flight=grown, dropped=False)
+
+    assert grown > 50
+    assert limit.limit < grown
@@ -0,0 +1,49 @@
+import pytest
+
+from benchmarks import run
+from benchmarks.harness import (
+    CallCase,
+    Result,
+    compare,
+    load_baseline,
+    run_inprocess,
+    save_baseline,
+)
+
+
+@pytest.mark.asyncio
+async def test_baseline_round_trip_and_regression_gate(tmp_path):
+    result = await run_inprocess(CallCase("noop", lambda i: None), 20, 2)
+    path = tmp_path / "baseline.json"
+
+    save_baseline(path, [result])
+    baseline = load_baseline(path)
+
+    assert result.iterations == 20
+    assert compare([result], baseline, threshold=0.15) == []
+
+    slower = Result("noop", 20, 1.0, baseline["noop"]["mean_us"] * 2 + 1, 0, 0)
+    regressions = compare([slower], baseline, threshold=0.15)
+    assert len(regressions) == 1
+    assert regressions[0].startswith("noop:")
+
+
+def test_missing_baseline_is_empty(tmp_path):
+    assert load_baseline(tmp_path / "missing.json") == {}
+
+
+def test_missing_baseline_cases_fail_the_gate():
+    baseline = {"gone": {"mean_us": 1.0}}
+
+    assert compare([], baseline, threshold=0.15) == [
+        "gone: in the baseline but did not run"
+    ]
+    assert compare([], baseline, threshold=0.15, require_all=False) == []
+
+
+def test_suite_load_failure_fails_unless_allowed(tmp_path, monkeypatch):
+    monkeypatch.setattr(run, "SUITES", ("benchmarks.does_not_exist",))
+    baseline = ["--baseline", str(tmp_path / "baseline.json")]
+
+    assert run.main(baseline) == 1
+    assert run.main(baseline + ["--allow-skip"]) == 0
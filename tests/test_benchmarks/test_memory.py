@@ -0,0 +1,47 @@
+import importlib
+import uuid
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from benchmarks import bench_memory
+
+
+@pytest.fixture
+def users(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'users.db'}")
+    users = importlib.import_module("database.test")
+    run = uuid.uuid4().hex[:8]
+    db = users.SessionLocal()
+    try:
+        db.add_all(
+            [
+                users.User(name="plain", email=f"plain-{run}@example.com"),
+                users.User(name='quote " and ü', email=f"esc-{run}@example.com"),
+            ]
+        )
+        db.commit()
+    finally:
+        db.close()
+    return users
+
+
+@pytest.mark.asyncio
+async def test_lean_list_matches_orm_response(users):
+    responses = []
+    for app in (users.app, bench_memory._orm_app(users)):
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as ac:
+            responses.append(await ac.get("/users/"))
+    lean, orm = responses
+
+    assert lean.headers["content-type"] == "application/json"
+    assert lean.json() == orm.json()
+    assert {"name": 'quote " and ü'}.items() <= lean.json()[-1].items()
+
+
+def test_run_case_reports_allocations_and_rss(users):
+    result = bench_memory.run_case("lean", iterations=2)
+
+    assert result["peak_alloc_kib"] > 0
+    assert set(result) >= {"mean_alloc_kib", "rss_kib", "rss_growth_kib"}
@@ -1,9 +1,11 @@
+import asyncio
+
 import pytest
-from fastapi import FastAPI, Request
+from fastapi import Depends, FastAPI, Request
 from httpx import ASGITransport, AsyncClient
 
+from providers.form.methods.data_strategies import FormDataStrategy, JSONDataStrategy
 from providers.form.methods.forms import build_form_class, create_field
-from providers.form.strategy.fs import FormDataStrategy
 
 
 @pytest.fixture
@@ -38,3 +40,54 @@ async def test_dynamic_form_submission(test_app):
     assert response.json() == {
         "data": {"username": "testuser", "password": "secret123"}
     }
+
+
+@pytest.mark.asyncio
+async def test_load_returns_a_slotted_record_per_request():
+    fields = [create_field("username", str), create_field("age", int)]
+    LeanForm = build_form_class("LeanForm", fields, FormDataStrategy())
+    app = FastAPI()
+
+    @app.post("/lean")
+    async def lean(request: Request):
+        form = LeanForm()
+        record = await form.load(request)
+        await asyncio.sleep(0.01)
+        assert form.data is None
+        assert not hasattr(form, "__dict__")
+        assert not hasattr(record, "__dict__")
+        return {"got": record.username, "data": form.to_dict()}
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as ac:
+        responses = await asyncio.gather(
+            *(
+                ac.post("/lean", data={"username": f"u{i}", "age": str(i)})
+                for i in range(5)
+            )
+        )
+
+    assert [r.json() for r in responses] == [
+        {"got": f"u{i}", "data": {"username": f"u{i}", "age": i}} for i in range(5)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_strategies_work_as_dependencies():
+    app = FastAPI()
+
+    @app.post("/json")
+    async def json_body(data: dict = Depends(JSONDataStrategy().extract)):
+        return data
+
+    @app.post("/form")
+    async def form_body(data: dict = Depends(FormDataStrategy().extract)):
+        return data
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as ac:
+        json_response = await ac.post("/json", json={"name": "a"})
+        form_response = await ac.post("/form", data={"name": "b"})
+
+    assert json_response.json() == {"name": "a"}
+    assert form_response.json() == {"name": "b"}
@@ -0,0 +1,84 @@
+import time
+
+import jwt
+import pytest
+
+from providers.auth.methods.auth_jwt import JWTAuth
+from providers.hpc.methods.power_check import (
+    CompositionRejected,
+    CostBudget,
+    CostProfile,
+    HardwarePowerCheck,
+)
+from providers.hpc.methods.probes import AuthProbe, TemplateRenderProbe
+from providers.hpc.strategy.hpc_strategy import CostProbe
+from providers.template_loader.methods.jinja_loader import JinjaTemplateLoader
+
+SECRET_KEY = "test-secret-key"
+
+
+class FixedProbe(CostProbe):
+    async def run(self) -> None:
+        pass
+
+
+def make_profile(name, p99_ns, required=True):
+    return CostProfile(
+        name=name,
+        required=required,
+        iterations=1,
+        cpu_ns=p99_ns,
+        p99_ns=p99_ns,
+        alloc_bytes=0,
+    )
+
+
+@pytest.mark.asyncio
+async def test_profiles_real_providers(tmp_path):
+    (tmp_path / "index.html").write_text("<h1>{{ title }}</h1>")
+    token = jwt.encode(
+        {"sub": "test-user", "exp": int(time.time()) + 600}, SECRET_KEY, "HS256"
+    )
+    hpc = HardwarePowerCheck(CostBudget(), iterations=20, warmup=2)
+
+    decision = await hpc.check(
+        [
+            AuthProbe(JWTAuth(SECRET_KEY), {"Authorization": f"Bearer {token}"}),
+            TemplateRenderProbe(
+                JinjaTemplateLoader(str(tmp_path)), "index.html", {"title": "hi"}
+            ),
+        ]
+    )
+
+    assert decision.verdict == "accept"
+    assert decision.enabled == ["auth", "template"]
+    assert decision.profiles["auth"].p99_ns > 0
+    assert decision.profiles["template"].alloc_bytes > 0
+
+
+def test_degrades_by_disabling_expensive_optional_modules():
+    hpc = HardwarePowerCheck(CostBudget(p99_ns=300))
+    hpc.profiles = {
+        "auth": make_profile("auth", 100),
+        "template": make_profile("template", 500, required=False),
+        "form": make_profile("form", 100, required=False),
+    }
+
+    decision = hpc.decide(["auth", "template", "form"])
+
+    assert decision.verdict == "degrade"
+    assert decision.enabled == ["auth", "form"]
+    assert decision.disabled == ["template"]
+    assert decision.exceeded == ["p99_ns"]
+
+
+@pytest.mark.asyncio
+async def test_rejects_when_required_modules_exceed_budget():
+    hpc = HardwarePowerCheck(CostBudget(cpu_ns=-1), iterations=5, warmup=0)
+
+    with pytest.raises(CompositionRejected) as exc_info:
+        await hpc.check([FixedProbe("auth")])
+
+    assert exc_info.value.decision.verdict == "reject"
+    decision = await hpc.check([FixedProbe("auth")], enforce=False)
+    assert decision.verdict == "reject"
@@ -0,0 +1,154 @@
+import logging
+import time
+
+import jwt
+import pytest
+from fastapi import Depends, FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+
+from providers.auth.methods.auth_jwt import JWTAuth
+from providers.instrumentation.methods.events import EventLogger
+from providers.instrumentation.methods.prometheus import (
+    build_metrics_router,
+    render_prometheus_text,
+)
+from providers.instrumentation.methods.recorder import RECORDER
+from providers.instrumentation.strategy.instrumentation_strategy import (
+    MetricsExporter,
+)
+from providers.template_loader.methods.jinja_loader import JinjaTemplateLoader
+
+SECRET_KEY = "test-secret-key"
+
+
+class ListExporter(MetricsExporter):
+    def __init__(self):
+        self.records = []
+
+    def record(self, stage, strategy, duration_ns, alloc_blocks):
+        self.records.append((stage, strategy, duration_ns))
+
+
+@pytest.fixture
+def recorder():
+    RECORDER.reset()
+    RECORDER.enable(track_allocations=True)
+    yield RECORDER
+    RECORDER.disable()
+    RECORDER.reset()
+    RECORDER.exporters.clear()
+
+
+def build_app(jwt_auth):
+    app = FastAPI()
+    app.include_router(build_metrics_router())
+
+    @app.get("/protected", dependencies=[Depends(jwt_auth.authenticate)])
+    async def protected_route(request: Request):
+        return {"user": request.state.user_payload}
+
+    return app
+
+
+@pytest.mark.asyncio
+async def test_stages_are_exposed_as_prometheus_text(recorder):
+    exporter = ListExporter()
+    recorder.add_exporter(exporter)
+    token = jwt.encode(
+        {"sub": "test-user", "exp": int(time.time()) + 600}, SECRET_KEY, "HS256"
+    )
+
+    transport = ASGITransport(app=build_app(JWTAuth(SECRET_KEY)))
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get(
+            "/protected", headers={"Authorization": f"Bearer {token}"}
+        )
+        assert response.status_code == 200
+        metrics = await client.get("/metrics")
+
+    labels = 'stage="auth.authenticate",strategy="JWTAuth"'
+    assert metrics.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert f'providers_stage_duration_seconds_bucket{{{labels},le="+Inf"}} 1' in (
+        metrics.text
+    )
+    assert f"providers_stage_duration_seconds_count{{{labels}}} 1" in metrics.text
+    assert exporter.records[0][:2] == ("auth.authenticate", "JWTAuth")
+
+
+def test_net_allocations_are_exposed_as_a_gauge(recorder):
+    recorder.observe("auth.authenticate", "JWTAuth", 1_000, alloc_blocks=3)
+    recorder.observe("auth.authenticate", "JWTAuth", 1_000, alloc_blocks=-5)
+
+    text = render_prometheus_text(recorder)
+
+    labels = 'stage="auth.authenticate",strategy="JWTAuth"'
+    assert "# TYPE providers_stage_net_alloc_blocks gauge" in text
+    assert f"providers_stage_net_alloc_blocks{{{labels}}} -2" in text
+
+
+def test_disabled_recorder_records_nothing(tmp_path):
+    (tmp_path / "index.html").write_text("<h1>{{ title }}</h1>")
+    RECORDER.reset()
+
+    response = JinjaTemplateLoader(str(tmp_path)).render("index.html", {"title": "x"})
+
+    assert response.body == b"<h1>x</h1>"
+    assert RECORDER.stages == {}
+
+
+def test_template_render_is_timed(recorder, tmp_path):
+    (tmp_path / "index.html").write_text("<h1>{{ title }}</h1>")
+
+    JinjaTemplateLoader(str(tmp_path)).render("index.html", {"title": "x"})
+
+    histogram = recorder.stages[("template.render", "JinjaTemplateLoader")]
+    assert histogram.count == 1
+    assert histogram.sum_ns > 0
+
+
+@pytest.mark.asyncio
+async def test_overrides_calling_super_are_recorded_once(recorder):
+    class AuditedAuth(JWTAuth):
+        async def authenticate(self, request: Request):
+            return await super().authenticate(request)
+
+    token = jwt.encode(
+        {"sub": "test-user", "exp": int(time.time()) + 600}, SECRET_KEY, "HS256"
+    )
+    transport = ASGITransport(app=build_app(AuditedAuth(SECRET_KEY)))
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get(
+            "/protected", headers={"Authorization": f"Bearer {token}"}
+        )
+
+    assert response.status_code == 200
+    assert {key: h.count for key, h in recorder.stages.items()} == {
+        ("auth.authenticate", "AuditedAuth"): 1
+    }
+
+
+@pytest.mark.asyncio
+async def test_jwt_verification_error_is_a_structured_event(caplog):
+    token = jwt.encode({"sub": "test-user"}, SECRET_KEY, "HS256")
+    transport = ASGITransport(app=build_app(JWTAuth(SECRET_KEY, algorithm="RS256")))
+
+    with caplog.at_level(logging.WARNING, logger="providers.events"):
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get(
+                "/protected", headers={"Authorization": f"Bearer {token}"}
+            )
+
+    assert response.status_code == 500
+    record = caplog.records[-1]
+    assert record.event == "jwt.verification_error"
+    assert record.fields["algorithm"] == "RS256"
+
+
+def test_events_are_rate_limited(caplog):
+    events = EventLogger(logging.getLogger("test.events"), rate=0.0, burst=2)
+
+    with caplog.at_level(logging.WARNING, logger="test.events"):
+        emitted = [events.emit("boom", detail=i) for i in range(5)]
+
+    assert emitted == [True, True, False, False, False]
+    assert len(caplog.records) == 2
@@ -0,0 +1,163 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import HTMLResponse
+from httpx import ASGITransport, AsyncClient
+
+from providers.response_cache.methods.etag_middleware import (
+    CachePolicy,
+    ResponseCacheMiddleware,
+)
+from providers.response_cache.methods.memory_cache import MemoryResponseCache
+from providers.template_loader.methods.jinja_loader import JinjaTemplateLoader
+
+
+@pytest.fixture
+def test_app(tmp_path):
+    (tmp_path / "page.html").write_text("<h1>{{ title }}</h1>")
+    loader = JinjaTemplateLoader(templates_dir=str(tmp_path))
+    app = FastAPI()
+    app.state.renders = 0
+    app.state.title = "first"
+
+    @app.get("/pages/{name}")
+    async def page(name: str):
+        app.state.renders += 1
+        return loader.render("page.html", {"title": app.state.title})
+
+    @app.put("/pages/{name}")
+    async def update_page(name: str):
+        app.state.title = "second"
+        return {"updated": name}
+
+    @app.get("/big")
+    async def big():
+        return HTMLResponse("x" * 2048)
+
+    app.add_middleware(
+        ResponseCacheMiddleware,
+        policies={"/pages/{name}": CachePolicy(), "/big": CachePolicy()},
+        max_entry_bytes=1024,
+    )
+    return app
+
+
+@pytest.mark.asyncio
+async def test_if_none_match_returns_304_without_rendering(test_app):
+    transport = ASGITransport(app=test_app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        first = await client.get("/pages/home")
+        etag = first.headers["etag"]
+        second = await client.get("/pages/home", headers={"If-None-Match": etag})
+
+    assert first.status_code == 200
+    assert first.text == "<h1>first</h1>"
+    assert first.headers["cache-control"] == "public, no-cache"
+    assert second.status_code == 304
+    assert second.headers["etag"] == etag
+    assert second.content == b""
+    assert test_app.state.renders == 1
+
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_cached_responses(test_app):
+    transport = ASGITransport(app=test_app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        etag = (await client.get("/pages/home")).headers["etag"]
+        await client.put("/pages/home")
+        response = await client.get("/pages/home", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.text == "<h1>second</h1>"
+    assert response.headers["etag"] != etag
+    assert test_app.state.renders == 2
+
+
+@pytest.mark.asyncio
+async def test_large_bodies_stream_through_uncached(test_app):
+    transport = ASGITransport(app=test_app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/big")
+
+    assert response.status_code == 200
+    assert len(response.content) == 2048
+    assert "etag" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_get_racing_a_write_is_not_cached():
+    app = FastAPI()
+    app.state.value = "old"
+    app.state.read = asyncio.Event()
+    app.state.release = asyncio.Event()
+
+    @app.get("/items/{item}")
+    async def read(item: str):
+        value = app.state.value
+        app.state.read.set()
+        await app.state.release.wait()
+        return {"v": value}
+
+    @app.put("/items/{item}")
+    async def write(item: str):
+        app.state.value = "new"
+        return {"updated": item}
+
+    app.add_middleware(
+        ResponseCacheMiddleware, policies={"/items/{item}": CachePolicy()}
+    )
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        racing = asyncio.create_task(client.get("/items/1"))
+        await app.state.read.wait()
+        await client.put("/items/1")
+        app.state.release.set()
+        stale = await racing
+        fresh = await client.get("/items/1")
+
+    assert stale.json() == {"v": "old"}
+    assert fresh.json() == {"v": "new"}
+
+
+def test_private_policy_requires_authorization_vary():
+    with pytest.raises(ValueError):
+        CachePolicy(private=True)
+
+    assert CachePolicy(private=True, vary=("Authorization",)).per_user
+
+
+@pytest.mark.asyncio
+async def test_per_user_responses_are_not_shared():
+    app = FastAPI()
+
+    @app.get("/me")
+    async def me(request: Request):
+        user = request.headers.get("authorization", "anonymous")
+        return Response(user, headers={"cache-control": "private, no-cache"})
+
+    backend = MemoryResponseCache()
+    app.add_middleware(
+        ResponseCacheMiddleware, policies={"/me": CachePolicy()}, backend=backend
+    )
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        alice = await client.get("/me", headers={"Authorization": "alice"})
+        bob = await client.get("/me", headers={"Authorization": "bob"})
+
+    assert alice.text == "alice"
+    assert bob.text == "bob"
+    assert backend.get("/me?#") is None
+
+
+def test_memory_cache_is_bounded():
+    from providers.response_cache.strategy.cache_strategy import CachedResponse
+
+    cache = MemoryResponseCache(max_entries=2)
+    for i in range(3):
+        cache.set(f"/k{i}", CachedResponse('"e"', 200, [], b"body", 0.0))
+
+    assert len(cache) == 2
+    assert cache.get("/k0") is None
+    assert cache.invalidate("/k") == 2
+    assert cache.size == 0
@@ -0,0 +1,160 @@
+import json
+import socket
+import threading
+import time
+
+import grpc
+import jwt
+import pytest
+import pytest_asyncio
+from sqlalchemy import Column, Integer, String, create_engine
+from sqlalchemy.orm import declarative_base, sessionmaker
+
+from providers.auth.methods.auth_jwt import JWTAuth
+from providers.response_cache.methods.memory_cache import MemoryResponseCache
+from providers.response_cache.strategy.cache_strategy import CachedResponse
+from providers.rpc.methods.services import AuthService, UsersService, build_server
+from providers.rpc.protos import providers_pb2, providers_pb2_grpc
+
+SECRET_KEY = "test-secret-key"
+Base = declarative_base()
+
+
+class User(Base):
+    __tablename__ = "users"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+    email = Column(String, unique=True)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def cache():
+    return MemoryResponseCache()
+
+
+@pytest_asyncio.fixture
+async def channel(tmp_path, cache):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'users.db'}",
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine)
+
+    address = f"127.0.0.1:{free_port()}"
+    server = build_server(
+        address,
+        users=UsersService(session_factory, User, cache=cache),
+        auth=AuthService(JWTAuth(SECRET_KEY)),
+    )
+    await server.start()
+    async with grpc.aio.insecure_channel(address) as channel:
+        yield channel
+    await server.stop(grace=None)
+
+
+@pytest.mark.asyncio
+async def test_users_crud(channel):
+    users = providers_pb2_grpc.UsersStub(channel)
+
+    created = await users.CreateUser(providers_pb2.UserCreate(name="a", email="a@x"))
+    fetched = await users.GetUser(providers_pb2.UserId(id=created.id))
+    updated = await users.UpdateUser(
+        providers_pb2.UserUpdate(id=created.id, name="b", email="b@x")
+    )
+    deleted = await users.DeleteUser(providers_pb2.UserId(id=created.id))
+
+    assert fetched == created
+    assert updated.name == "b"
+    assert deleted.message == "User deleted successfully"
+    with pytest.raises(grpc.aio.AioRpcError) as exc_info:
+        await users.GetUser(providers_pb2.UserId(id=created.id))
+    assert exc_info.value.code() == grpc.StatusCode.NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_the_rest_cache(channel, cache):
+    users = providers_pb2_grpc.UsersStub(channel)
+    created = await users.CreateUser(providers_pb2.UserCreate(name="a", email="a@x"))
+
+    update = providers_pb2.UserUpdate(id=created.id, name="b", email="b@x")
+    key = f"/users/{created.id}?#"
+
+    cache.set(key, CachedResponse('"e"', 200, [], b"{}", 0.0))
+    await users.UpdateUser(update)
+    assert cache.get(key) is None
+
+    cache.set(key, CachedResponse('"e"', 200, [], b"{}", 0.0))
+    await users.DeleteUser(providers_pb2.UserId(id=created.id))
+    assert cache.get(key) is None
+
+
+@pytest.mark.asyncio
+async def test_cache_is_invalidated_on_the_event_loop(channel, cache, monkeypatch):
+    threads = []
+    invalidate = cache.invalidate
+    monkeypatch.setattr(
+        cache,
+        "invalidate",
+        lambda prefix: threads.append(threading.get_ident()) or invalidate(prefix),
+    )
+    users = providers_pb2_grpc.UsersStub(channel)
+
+    created = await users.CreateUser(providers_pb2.UserCreate(name="a", email="a@x"))
+    await users.UpdateUser(
+        providers_pb2.UserUpdate(id=created.id, name="b", email="b@x")
+    )
+    await users.DeleteUser(providers_pb2.UserId(id=created.id))
+
+    assert threads == [threading.get_ident()] * 3
+
+
+@pytest.mark.asyncio
+async def test_streaming_bulk_reads(channel):
+    users = providers_pb2_grpc.UsersStub(channel)
+    for i in range(7):
+        await users.CreateUser(providers_pb2.UserCreate(name=f"u{i}", email=f"{i}@x"))
+
+    listed = [
+        user
+        async for user in users.ListUsers(providers_pb2.ListUsersRequest(page_size=3))
+    ]
+    found = [
+        user async for user in users.SearchUsers(providers_pb2.UserQuery(name="u1"))
+    ]
+
+    async def ids():
+        for user_id in (2, 99, 5):
+            yield providers_pb2.UserId(id=user_id)
+
+    bulk = [user.id async for user in users.GetUsers(ids())]
+
+    assert [user.name for user in listed] == [f"u{i}" for i in range(7)]
+    assert [user.name for user in found] == ["u1"]
+    assert bulk == [2, 5]
+
+
+@pytest.mark.asyncio
+async def test_verify_token(channel):
+    auth = providers_pb2_grpc.AuthStub(channel)
+    valid = jwt.encode({"sub": "u", "exp": int(time.time()) + 600}, SECRET_KEY)
+    expired = jwt.encode({"sub": "u", "exp": int(time.time()) - 10}, SECRET_KEY)
+
+    response = await auth.VerifyToken(providers_pb2.VerifyTokenRequest(token=valid))
+
+    async def tokens():
+        for token in (expired, "invalid.token.value"):
+            yield providers_pb2.VerifyTokenRequest(token=token)
+
+    errors = [r.error async for r in auth.VerifyTokens(tokens())]
+
+    assert response.valid
+    assert json.loads(response.payload_json)["sub"] == "u"
+    assert errors == ["Token has expired", "Invalid token"]
@@ -0,0 +1,106 @@
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+from providers.serving.methods.prefork import memory_usage_kib
+
+ROOT = Path(__file__).resolve().parents[2]
+
+SERVER = """
+import logging, sys
+from fastapi import FastAPI
+from providers.serving.methods.prefork import serve
+
+logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+app = FastAPI()
+
+@app.get("/")
+async def index():
+    import os
+    return {"pid": os.getpid()}
+
+serve(app, host="127.0.0.1", port=int(sys.argv[1]), workers=2, log_level="warning")
+"""
+
+CRASHING_SERVER = """
+import logging, sys
+from fastapi import FastAPI
+from providers.serving.methods.prefork import serve
+
+def broken():
+    raise RuntimeError("database unreachable")
+
+logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+serve(
+    FastAPI(),
+    host="127.0.0.1",
+    port=int(sys.argv[1]),
+    workers=2,
+    after_fork=[broken],
+    max_restarts=3,
+    restart_backoff=0.01,
+)
+"""
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_memory_usage_reports_rss():
+    assert memory_usage_kib()["rss"] > 0
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+def test_serves_with_multiple_workers():
+    port = free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-c", SERVER, str(port)],
+        cwd=ROOT,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        deadline = time.monotonic() + 20
+        while True:
+            try:
+                response = httpx.get(f"http://127.0.0.1:{port}/")
+                break
+            except httpx.TransportError:
+                assert time.monotonic() < deadline, "server did not start"
+                time.sleep(0.1)
+        assert response.status_code == 200
+    finally:
+        process.send_signal(signal.SIGTERM)
+        _, stderr = process.communicate(timeout=20)
+
+    assert process.returncode == 0
+    assert "preloaded 0 hooks" in stderr
+    assert stderr.count("ready: warm-up=") == 2
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+def test_gives_up_when_workers_keep_crashing():
+    process = subprocess.run(
+        [sys.executable, "-c", CRASHING_SERVER, str(free_port())],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        timeout=20,
+    )
+
+    assert process.returncode != 0
+    assert "giving up" in process.stderr
+    assert "WorkerCrashLoop" in process.stderr
+    assert process.stderr.count("restarting in") == 3
@@ -0,0 +1,93 @@
+import os
+import pickle
+import time
+
+import pytest
+
+from providers.response_cache.methods.shared_cache import SharedResponseCache
+from providers.response_cache.strategy.cache_strategy import CachedResponse
+from providers.serving.methods.shared_kv import SharedKVSegment
+
+
+@pytest.fixture
+def segment():
+    segment = SharedKVSegment(slots=64, slot_size=256)
+    yield segment
+    segment.close()
+
+
+def test_set_get_delete(segment):
+    assert segment.set("user:1", b"alice")
+    assert segment.set("user:1", b"bob")
+
+    assert segment.get("user:1") == b"bob"
+    assert segment.delete("user:1")
+    assert segment.get("user:1") is None
+    assert not segment.set("too-big", b"x" * 256)
+
+
+def test_expired_values_are_not_returned(segment):
+    segment.set("token", b"payload", ttl=0.01)
+    time.sleep(0.02)
+
+    assert segment.get("token") is None
+
+
+def test_invalidate_by_prefix(segment):
+    for i in range(5):
+        segment.set(f"/users/{i}", b"row")
+    segment.set("/pages/1", b"page")
+
+    assert segment.invalidate("/users") == 5
+    assert segment.get("/pages/1") == b"page"
+
+
+def test_full_probe_window_evicts_instead_of_failing():
+    segment = SharedKVSegment(slots=4, slot_size=128, max_probe=4)
+    for i in range(10):
+        assert segment.set(f"key-{i}", b"value")
+
+    assert segment.get("key-9") == b"value"
+    segment.close()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+def test_values_are_shared_with_forked_workers(segment):
+    pid = os.fork()
+    if pid == 0:
+        segment.set("from-child", str(os.getpid()).encode())
+        os._exit(0)
+    os.waitpid(pid, 0)
+
+    assert segment.get("from-child") == str(pid).encode()
+
+
+def test_shared_response_cache_round_trip(segment):
+    cache = SharedResponseCache(segment)
+    response = CachedResponse('"abc"', 200, [(b"etag", b'"abc"')], b"<h1/>", 1.0)
+
+    cache.set("/pages/1?#", response)
+
+    assert cache.get("/pages/1?#") == response
+    generation = cache.generation("/pages")
+    assert cache.invalidate("/pages") == 1
+    assert cache.get("/pages/1?#") is None
+    assert cache.generation("/pages") == generation + 1
+
+
+class Exploit:
+    def __reduce__(self):
+        return (os.system, ("false",))
+
+
+def test_shared_response_cache_never_unpickles(segment, monkeypatch):
+    cache = SharedResponseCache(segment)
+    calls = []
+    monkeypatch.setattr(os, "system", calls.append)
+
+    segment.set("/pages/1?#", pickle.dumps(Exploit()))
+    segment.set("/pages/2?#", b"\x00" * 3)
+
+    assert cache.get("/pages/1?#") is None
+    assert cache.get("/pages/2?#") is None
+    assert calls == []
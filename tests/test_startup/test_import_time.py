@@ -0,0 +1,64 @@
+# python -m pytest tests/test_startup/test_import_time.py
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# Cumulative import time allowed for the lightweight entry points, in us.
+# FastAPI alone costs ~300ms, so any eager heavy import blows this budget.
+IMPORT_BUDGET_US = 60_000
+
+HEAVY_MODULES = ("fastapi", "starlette", "pydantic", "jinja2", "jwt")
+
+LIGHT_MODULES = [
+    "providers",
+    "providers.auth.strategy.auth_strategy",
+    "providers.form.strategy.fs",
+    "providers.form.methods.forms",
+    "providers.template_loader.strategy.jinja_strategy",
+    "providers.hpc.methods.power_check",
+]
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+
+
+def cumulative_import_time_us(module: str) -> int:
+    stderr = run_python("-X", "importtime", "-c", f"import {module}").stderr
+    for line in reversed(stderr.splitlines()):
+        _, cumulative, name = line.rsplit("|", 2)
+        if name.strip() == module:
+            return int(cumulative)
+    raise AssertionError(f"{module} not found in -X importtime output")
+
+
+@pytest.mark.parametrize("module", LIGHT_MODULES)
+def test_import_time_budget(module):
+    assert cumulative_import_time_us(module) < IMPORT_BUDGET_US
+
+
+@pytest.mark.parametrize("module", LIGHT_MODULES)
+def test_no_heavy_dependencies_on_import(module):
+    loaded = run_python(
+        "-c",
+        f"import sys, {module}; "
+        f"print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))",
+    ).stdout.split()
+    assert loaded == []
+
+
+def test_public_names_resolve_lazily():
+    import providers
+    from providers.auth.methods.auth_jwt import JWTAuth
+
+    assert providers.JWTAuth is JWTAuth
+    assert "JinjaTemplateLoader" in dir(providers)
+    with pytest.raises(AttributeError):
+        providers.DoesNotExist
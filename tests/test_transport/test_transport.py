@@ -0,0 +1,156 @@
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI, Response
+
+from providers.instrumentation.methods.recorder import RECORDER
+from providers.transport.methods.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+)
+from providers.transport.methods.pooled_client import ClientPool, PooledUpstreamClient
+
+
+@pytest.fixture
+def upstream():
+    app = FastAPI()
+    app.state.calls = 0
+    app.state.delays = []
+    app.state.status = 200
+
+    @app.get("/items/{item}")
+    async def item(item: str):
+        app.state.calls += 1
+        if app.state.delays:
+            await asyncio.sleep(app.state.delays.pop(0))
+        return Response(f'{{"item": "{item}"}}', app.state.status)
+
+    return app
+
+
+def make_client(app, **kwargs) -> PooledUpstreamClient:
+    return PooledUpstreamClient(
+        "http://upstream",
+        pool=ClientPool(),
+        transport=httpx.ASGITransport(app=app),
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_pool_shares_one_client_per_upstream(upstream):
+    pool = ClientPool(http2=False)
+    first = pool.client("http://a", httpx.ASGITransport(app=upstream))
+
+    assert pool.client("http://a") is first
+    assert pool.client("http://b") is not first
+    await pool.aclose()
+    assert first.is_closed
+
+
+@pytest.mark.asyncio
+async def test_coalesces_identical_in_flight_gets(upstream):
+    upstream.state.delays = [0.05]
+    node = make_client(upstream)
+
+    responses = await asyncio.gather(*(node.get("/items/1") for _ in range(10)))
+    other = await node.get("/items/1", headers={"Authorization": "Bearer other"})
+
+    assert [r.json() for r in responses] == [{"item": "1"}] * 10
+    assert other.status_code == 200
+    assert upstream.state.calls == 2
+    assert node.coalesced == 9
+    await node.aclose()
+
+
+@pytest.mark.asyncio
+async def test_caller_cancellation_does_not_cancel_shared_call(upstream):
+    upstream.state.delays = [0.05]
+    node = make_client(upstream)
+
+    leader = asyncio.create_task(node.get("/items/1"))
+    follower = asyncio.create_task(node.get("/items/1"))
+    await asyncio.sleep(0.01)
+    leader.cancel()
+
+    assert (await follower).json() == {"item": "1"}
+    assert upstream.state.calls == 1
+    await node.aclose()
+
+
+@pytest.mark.asyncio
+async def test_hedges_slow_requests(upstream):
+    upstream.state.delays = [1.0, 0.0]
+    node = make_client(upstream, hedge_after=0.02, coalesce=False)
+
+    response = await asyncio.wait_for(node.get("/items/1"), timeout=0.5)
+
+    assert response.json() == {"item": "1"}
+    assert node.hedged == 1
+    assert upstream.state.calls == 2
+    await node.aclose()
+
+
+@pytest.mark.asyncio
+async def test_circuit_opens_and_recovers(upstream):
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=5, clock=lambda: now[0])
+    node = make_client(upstream, breaker=breaker)
+    upstream.state.status = 503
+
+    for _ in range(2):
+        assert (await node.get("/items/1")).status_code == 503
+    with pytest.raises(CircuitOpenError) as exc_info:
+        await node.get("/items/1")
+
+    assert breaker.state == OPEN
+    assert exc_info.value.retry_after == 5
+    assert upstream.state.calls == 2
+
+    now[0] = 6.0
+    upstream.state.status = 200
+    breaker.before_call()
+    assert breaker.state == HALF_OPEN
+    breaker.record_cancelled()
+    assert (await node.get("/items/1")).status_code == 200
+    assert breaker.state == CLOSED
+    await node.aclose()
+
+
+def test_outcomes_of_calls_admitted_before_a_transition_are_ignored():
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5, clock=lambda: now[0])
+    slow = breaker.before_call()
+    breaker.record_failure(breaker.before_call())
+    assert breaker.state == OPEN
+
+    breaker.record_success(slow)
+    assert breaker.state == OPEN
+
+    now[0] = 6.0
+    trial = breaker.before_call()
+    assert breaker.state == HALF_OPEN
+    breaker.record_success(slow)
+    assert breaker.state == HALF_OPEN
+    breaker.record_success(trial)
+    assert breaker.state == CLOSED
+
+
+@pytest.mark.asyncio
+async def test_requests_are_recorded(upstream):
+    node = make_client(upstream)
+    RECORDER.reset()
+    RECORDER.enable()
+    try:
+        await node.get("/items/1")
+    finally:
+        RECORDER.disable()
+
+    assert RECORDER.stages[("transport.request", "PooledUpstreamClient")].count == 1
+    assert RECORDER.stages[("transport.attempt", "PooledUpstreamClient")].count == 1
+    RECORDER.reset()
+    await node.aclose()